@@ -1,11 +1,13 @@
 """Application configuration using Pydantic Settings."""
 
+import os
+from dataclasses import dataclass
 from enum import Enum
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TypedDict
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, TypeAdapter, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -18,6 +20,21 @@ class LLMProvider(str, Enum):
     OLLAMA = "ollama"
 
 
+_PROVIDERS_BY_VALUE: dict[str, LLMProvider] = {p.value: p for p in LLMProvider}
+
+
+def coerce_provider(provider: str | LLMProvider) -> LLMProvider:
+    """Convert a provider name to LLMProvider with a plain dict lookup.
+
+    Raises:
+        ValueError: If the name is not a known provider
+    """
+    member = _PROVIDERS_BY_VALUE.get(provider)
+    if member is None:
+        raise ValueError(f"{provider!r} is not a valid LLMProvider")
+    return member
+
+
 class LogFormat(str, Enum):
     """Log output formats."""
 
@@ -33,22 +50,55 @@ class Environment(str, Enum):
     PRODUCTION = "production"
 
 
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+
+
+def _coerce_env_value(annotation: Any, raw: str) -> Any:
+    """Coerce a raw environment string to a simple field type."""
+    if annotation is bool:
+        return raw.strip().lower() in _TRUE_VALUES
+    if annotation is int:
+        return int(raw)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation(raw)
+    return raw
+
+
+@dataclass(slots=True, frozen=True)
 class ProviderConfig:
     """Configuration for a specific LLM provider."""
 
-    def __init__(
-        self,
-        api_key: str | None = None,
-        model: str | None = None,
-        max_tokens: int = 4096,
-        base_url: str | None = None,
-        timeout: int = 120,
-    ) -> None:
-        self.api_key = api_key
-        self.model = model
-        self.max_tokens = max_tokens
-        self.base_url = base_url
-        self.timeout = timeout
+    api_key: str | None = None
+    model: str | None = None
+    max_tokens: int = 4096
+    base_url: str | None = None
+    timeout: int = 120
+
+    def to_kwargs(self) -> "ProviderKwargs":
+        """Get the set (truthy) fields as provider constructor kwargs."""
+        kwargs: ProviderKwargs = {}
+        if self.api_key:
+            kwargs["api_key"] = self.api_key
+        if self.model:
+            kwargs["model"] = self.model
+        if self.max_tokens:
+            kwargs["max_tokens"] = self.max_tokens
+        if self.base_url:
+            kwargs["base_url"] = self.base_url
+        if self.timeout:
+            kwargs["timeout"] = self.timeout
+        return kwargs
+
+
+class ProviderKwargs(TypedDict, total=False):
+    """Provider constructor kwargs derived from a ProviderConfig."""
+
+    api_key: str
+    model: str
+    max_tokens: int
+    base_url: str
+    timeout: int
 
 
 class Settings(BaseSettings):
@@ -105,6 +155,33 @@ class Settings(BaseSettings):
     app_env: Environment = Field(default=Environment.DEVELOPMENT)
     debug: bool = Field(default=True)
 
+    # Conversation History Configuration
+    history_stable_prefix: int = Field(
+        default=0,
+        description=(
+            "Leading messages of a conversation always sent to the LLM so the "
+            "prompt prefix stays cacheable (use an even number; 0 = sliding window)"
+        ),
+    )
+    history_max_rooms: int = Field(
+        default=10_000,
+        ge=0,
+        description=(
+            "Max conversations kept in memory; the least recently active are dropped "
+            "(0 = unlimited)"
+        ),
+    )
+
+    # Response Cache Configuration
+    response_cache_size: int = Field(
+        default=256, description="Max cached non-streamed LLM responses (0 disables)"
+    )
+
+    # Streaming Configuration
+    stream_min_delta_chars: int = Field(
+        default=40, description="Minimum new characters before a streamed message is updated"
+    )
+
     # Logging Configuration
     log_level: str = Field(default="DEBUG")
     log_format: LogFormat = Field(default=LogFormat.JSON)
@@ -113,14 +190,20 @@ class Settings(BaseSettings):
     # Users configuration file path
     users_config_path: str = Field(default="./users.json")
 
+    # Derived provider lookups (built once in model_post_init)
+    _provider_configs: dict[LLMProvider, ProviderConfig] = PrivateAttr(default_factory=dict)
+    _available_providers: tuple[LLMProvider, ...] = PrivateAttr(default=())
+    _available_provider_set: frozenset[LLMProvider] = PrivateAttr(default=frozenset())
+
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level is valid."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
         v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
+        if v_upper not in _VALID_LOG_LEVELS:
+            raise ValueError(
+                f"Invalid log level: {v}. Must be one of {sorted(_VALID_LOG_LEVELS)}"
+            )
         return v_upper
 
     @property
@@ -133,12 +216,43 @@ class Settings(BaseSettings):
         """Check if running in production mode."""
         return self.app_env == Environment.PRODUCTION
 
-    def get_provider_config(self, provider: str | LLMProvider) -> ProviderConfig:
-        """Get configuration for a specific provider."""
-        if isinstance(provider, str):
-            provider = LLMProvider(provider)
-
-        configs = {
+    @classmethod
+    def from_trusted_env(cls) -> "Settings":
+        """
+        Build settings from the process environment without full validation.
+
+        Intended for production, where the environment is trusted and
+        immutable. Falls back to the validated constructor, which reads both
+        the environment and the .env file, when a .env file is present
+        (hand-edited values get full validation) or a required field is
+        missing.
+        """
+        env_file = cls.model_config.get("env_file")
+        if isinstance(env_file, str) and Path(env_file).is_file():
+            return cls.model_validate({})
+
+        env = {key.lower(): value for key, value in os.environ.items()}
+        data: dict[str, Any] = {}
+
+        for name, field in cls.model_fields.items():
+            if name not in env:
+                if field.is_required():
+                    return cls.model_validate({})
+                continue
+            value = _coerce_env_value(field.annotation, env[name])
+            if field.metadata:
+                # Constrained fields (e.g. ge=0) are still checked
+                value = TypeAdapter(field.rebuild_annotation()).validate_python(value)
+            data[name] = value
+
+        if "log_level" in data:
+            data["log_level"] = cls.validate_log_level(data["log_level"])
+
+        return cls.model_construct(**data)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute provider lookups; settings are immutable once loaded."""
+        self._provider_configs = {
             LLMProvider.ANTHROPIC: ProviderConfig(
                 api_key=self.anthropic_api_key,
                 model=self.anthropic_model,
@@ -160,10 +274,7 @@ class Settings(BaseSettings):
                 timeout=self.ollama_timeout,
             ),
         }
-        return configs[provider]
 
-    def get_available_providers(self) -> list[LLMProvider]:
-        """Get list of providers with valid configuration."""
         providers = []
 
         if self.anthropic_api_key:
@@ -176,16 +287,25 @@ class Settings(BaseSettings):
         # Ollama is always available (local)
         providers.append(LLMProvider.OLLAMA)
 
-        return providers
+        self._available_providers = tuple(providers)
+        self._available_provider_set = frozenset(providers)
+
+    def get_provider_config(self, provider: str | LLMProvider) -> ProviderConfig:
+        """Get configuration for a specific provider."""
+        return self._provider_configs[coerce_provider(provider)]
+
+    def get_available_providers(self) -> tuple[LLMProvider, ...]:
+        """Get providers with valid configuration."""
+        return self._available_providers
 
     def is_provider_available(self, provider: str | LLMProvider) -> bool:
         """Check if a provider is configured and available."""
-        if isinstance(provider, str):
-            provider = LLMProvider(provider)
-        return provider in self.get_available_providers()
+        return coerce_provider(provider) in self._available_provider_set
 
 
 @lru_cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
+    if os.environ.get("APP_ENV", "").lower() == Environment.PRODUCTION.value:
+        return Settings.from_trusted_env()
     return Settings()
@@ -1,14 +1,32 @@
-"""Core utilities and configuration."""
+"""Core utilities and configuration.
 
-from app.core.logging import get_logger, setup_logging
-from app.core.exceptions import (
-    BotException,
-    ConfigurationError,
-    LLMError,
-    LLMProviderError,
-    MCPError,
-    WebexAPIError,
-)
+Exports are imported lazily (PEP 562) to keep package import cheap.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.core.exceptions import (
+        BotException,
+        ConfigurationError,
+        LLMError,
+        LLMProviderError,
+        MCPError,
+        WebexAPIError,
+    )
+    from app.core.logging import get_logger, setup_logging
+
+_LAZY_IMPORTS = {
+    "get_logger": "app.core.logging",
+    "setup_logging": "app.core.logging",
+    "BotException": "app.core.exceptions",
+    "ConfigurationError": "app.core.exceptions",
+    "LLMError": "app.core.exceptions",
+    "LLMProviderError": "app.core.exceptions",
+    "MCPError": "app.core.exceptions",
+    "WebexAPIError": "app.core.exceptions",
+}
 
 __all__ = [
     "get_logger",
@@ -20,3 +38,12 @@ __all__ = [
     "MCPError",
     "WebexAPIError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
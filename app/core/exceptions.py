@@ -10,11 +10,11 @@ class BotException(Exception):
         super().__init__(message)
         self.message = message
         self.details = details or {}
+        # Formatted once; exceptions are stringified repeatedly when logged
+        self._str = f"{message} - {self.details}" if self.details else message
 
     def __str__(self) -> str:
-        if self.details:
-            return f"{self.message} - {self.details}"
-        return self.message
+        return self._str
 
 
 class ConfigurationError(BotException):
@@ -58,13 +58,8 @@ class LLMProviderError(LLMError):
         self.model = model
         self.status_code = status_code
 
-    def __str__(self) -> str:
-        base = f"[{self.provider}] {self.message}"
-        if self.model:
-            base = f"[{self.provider}/{self.model}] {self.message}"
-        if self.details:
-            base = f"{base} - {self.details}"
-        return base
+        prefix = f"[{provider}/{model}]" if model else f"[{provider}]"
+        self._str = f"{prefix} {self._str}"
 
 
 class LLMRateLimitError(LLMProviderError):
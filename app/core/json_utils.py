@@ -0,0 +1,22 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import importlib
+import json
+from collections.abc import Callable
+from typing import Any
+
+# orjson's JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch the stdlib error whichever parser is in use.
+JSONDecodeError = json.JSONDecodeError
+
+
+def _select_loads() -> Callable[[str | bytes], Any]:
+    try:
+        orjson = importlib.import_module("orjson")  # optional, faster and parses bytes directly
+    except ImportError:
+        return json.loads
+    loads: Callable[[str | bytes], Any] = orjson.loads
+    return loads
+
+
+json_loads = _select_loads()
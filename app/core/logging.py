@@ -1,18 +1,61 @@
 """Structured logging configuration using structlog."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import cast
 
 import structlog
-from structlog.types import Processor
+from structlog.types import EventDict, Processor, WrappedLogger
 
 from app.config import get_settings, LogFormat
 
+# Background listener that performs file writes off the request path
+_queue_listener: QueueListener | None = None
+
+_stack_info_renderer = structlog.processors.StackInfoRenderer(additional_ignores=[__name__])
+
+
+def _render_stack_info(
+    logger: WrappedLogger, method_name: str, event_dict: EventDict
+) -> EventDict:
+    """Run StackInfoRenderer only for events that request stack info."""
+    if "stack_info" in event_dict:
+        return _stack_info_renderer(logger, method_name, event_dict)
+    return event_dict
+
+
+def _format_exc_info(
+    logger: WrappedLogger, method_name: str, event_dict: EventDict
+) -> EventDict:
+    """Run format_exc_info only for events that carry exception info."""
+    if "exc_info" in event_dict:
+        return structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background file-logging listener, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def setup_logging() -> None:
     """Configure structured logging for the application."""
+    global _queue_listener
+
     settings = get_settings()
+    _stop_queue_listener()
 
     # Ensure log directory exists
     if settings.log_file_path:
@@ -25,7 +68,7 @@ def setup_logging() -> None:
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
+        _render_stack_info,
         structlog.processors.UnicodeDecoder(),
     ]
 
@@ -41,7 +84,7 @@ def setup_logging() -> None:
         # Production: JSON output
         final_processors = [
             *shared_processors,
-            structlog.processors.format_exc_info,
+            _format_exc_info,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ]
         renderer = structlog.processors.JSONRenderer()
@@ -49,7 +92,10 @@ def setup_logging() -> None:
     # Configure structlog
     structlog.configure(
         processors=final_processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Filtering logger drops below-threshold events before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(settings.log_level)
+        ),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -68,12 +114,18 @@ def setup_logging() -> None:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
 
-    # File handler (if configured)
+    # File handler (if configured). Records are rendered by the QueueHandler
+    # and written by a listener thread, so disk I/O never blocks the caller.
     handlers: list[logging.Handler] = [console_handler]
     if settings.log_file_path:
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(formatter)
+        handlers.append(queue_handler)
+
         file_handler = logging.FileHandler(settings.log_file_path)
-        file_handler.setFormatter(formatter)
-        handlers.append(file_handler)
+        _queue_listener = QueueListener(log_queue, file_handler)
+        _queue_listener.start()
 
     # Configure root logger
     root_logger = logging.getLogger()
@@ -88,11 +140,16 @@ def setup_logging() -> None:
 
 
 def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
-    """Get a logger instance with optional component name."""
-    logger = structlog.get_logger()
+    """Get a logger instance with optional component name.
+
+    The component is passed as an initial value of the lazy proxy rather
+    than via ``bind()``, so the logger is only assembled on first use
+    (after ``setup_logging()``) and then cached with the component baked
+    into its context.
+    """
     if name:
-        logger = logger.bind(component=name)
-    return logger
+        return cast(structlog.stdlib.BoundLogger, structlog.get_logger(component=name))
+    return cast(structlog.stdlib.BoundLogger, structlog.get_logger())
 
 
 class LogEvents:
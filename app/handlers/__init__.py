@@ -1,11 +1,34 @@
-"""Request handlers."""
+"""Request handlers.
 
-from app.handlers.webhook_handler import WebhookHandler
-from app.handlers.command_handler import CommandHandler
-from app.handlers.message_handler import MessageHandler
+Handlers are imported lazily (PEP 562) so importing one handler module
+does not pull in the others and their provider SDK dependencies.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.handlers.command_handler import CommandHandler
+    from app.handlers.message_handler import MessageHandler
+    from app.handlers.webhook_handler import WebhookHandler
+
+_LAZY_IMPORTS = {
+    "WebhookHandler": "app.handlers.webhook_handler",
+    "CommandHandler": "app.handlers.command_handler",
+    "MessageHandler": "app.handlers.message_handler",
+}
 
 __all__ = [
     "WebhookHandler",
     "CommandHandler",
     "MessageHandler",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -1,9 +1,11 @@
 """Handler for slash commands."""
 
 import re
+import sys
+from functools import lru_cache
 from typing import Any, Callable, Coroutine
 
-from app.config import LLMProvider, get_settings
+from app.config import LLMProvider, coerce_provider, get_settings
 from app.core.logging import get_logger, LogEvents
 from app.services.history_service import HistoryService
 from app.services.user_service import UserService
@@ -14,6 +16,67 @@ logger = get_logger("command_handler")
 # Type alias for command handlers
 CommandFunc = Callable[..., Coroutine[Any, Any, str]]
 
+_ALL_PROVIDERS: tuple[LLMProvider, ...] = tuple(LLMProvider)
+_PROVIDER_VALUES_JOINED = ", ".join(p.value for p in _ALL_PROVIDERS)
+
+_HELP_TEXT = """**Webex Presales Assistant** - Available Commands
+
+**General:**
+- `/help` - Show this help message
+- `/status` - Check bot and provider status
+- `/whoami` - Show your user information
+
+**Conversation:**
+- `/clear` - Clear conversation history
+- `/history` - Show conversation history stats
+
+**Model Selection:**
+- `/model` - Show current model
+- `/model <provider>` - Switch to a provider (anthropic, openai, gemini, ollama)
+- `/model <provider> <model>` - Switch to specific model
+- `/providers` - List available providers
+
+**Examples:**
+- `/model anthropic` - Use Claude
+- `/model openai gpt-4o` - Use GPT-4o
+- `/model ollama llama3.1:8b` - Use local Llama
+
+Just send a message to chat with the AI assistant!
+"""
+
+
+@lru_cache(maxsize=128)
+def _render_whoami(
+    email: str,
+    authorized: bool,
+    display_name: str | None,
+    provider: str | None,
+    model: str | None,
+    is_admin: bool,
+) -> str:
+    """Render /whoami output.
+
+    Keyed on every displayed field, so a reloaded user config simply
+    produces a new key and never serves stale output.
+    """
+    lines = [
+        "**Your Information:**",
+        "",
+        f"- Email: `{email}`",
+        f"- Authorized: `{authorized}`",
+    ]
+
+    if display_name:
+        lines.append(f"- Display Name: {display_name}")
+    if provider:
+        lines.append(f"- Preferred Provider: `{provider}`")
+    if model:
+        lines.append(f"- Preferred Model: `{model}`")
+    if is_admin:
+        lines.append("- Role: **Admin**")
+
+    return "\n".join(lines)
+
 
 class CommandHandler:
     """Handler for bot slash commands."""
@@ -27,11 +90,12 @@ class CommandHandler:
         self._history = history_service
         self._settings = get_settings()
         self._commands: dict[str, CommandFunc] = {}
+        self._providers_text: str | None = None
         self._register_commands()
 
     def _register_commands(self) -> None:
         """Register all available commands."""
-        self._commands = {
+        commands: dict[str, CommandFunc] = {
             "/help": self._cmd_help,
             "/status": self._cmd_status,
             "/clear": self._cmd_clear,
@@ -40,16 +104,22 @@ class CommandHandler:
             "/whoami": self._cmd_whoami,
             "/history": self._cmd_history,
         }
+        # Interned keys let lookups of interned commands short-circuit on identity
+        self._commands = {sys.intern(name): func for name, func in commands.items()}
+        self._sorted_command_list = ", ".join(sorted(self._commands))
 
     def is_command(self, text: str) -> bool:
         """Check if text is a command."""
-        return text.strip().startswith("/")
+        return text.lstrip().startswith("/")
 
-    def parse_command(self, text: str) -> tuple[str, list[str]]:
-        """Parse command and arguments from text."""
-        parts = text.strip().split()
-        command = parts[0].lower()
-        args = parts[1:] if len(parts) > 1 else []
+    def parse_command(self, text: str) -> tuple[str, list[str]] | None:
+        """Parse command and arguments from text, or None if not a command."""
+        # Only split off the command word; arguments are tokenized separately
+        parts = text.split(None, 1)
+        if not parts or not parts[0].startswith("/"):
+            return None
+        command = sys.intern(parts[0].lower())
+        args = parts[1].split() if len(parts) > 1 else []
         return command, args
 
     async def handle(
@@ -69,10 +139,11 @@ class CommandHandler:
         Returns:
             Response message, or None if not a command
         """
-        if not self.is_command(text):
+        parsed = self.parse_command(text)
+        if parsed is None:
             return None
 
-        command, args = self.parse_command(text)
+        command, args = parsed
 
         logger.info(
             LogEvents.COMMAND_DETECTED,
@@ -107,40 +178,19 @@ class CommandHandler:
 
     def _unknown_command(self, command: str) -> str:
         """Response for unknown commands."""
-        available = ", ".join(sorted(self._commands.keys()))
-        return f"Unknown command: `{command}`\n\nAvailable commands: {available}"
+        return (
+            f"Unknown command: `{command}`\n\n"
+            f"Available commands: {self._sorted_command_list}"
+        )
 
     async def _cmd_help(self, **kwargs: Any) -> str:
         """Show help information."""
-        return """**Webex Presales Assistant** - Available Commands
-
-**General:**
-- `/help` - Show this help message
-- `/status` - Check bot and provider status
-- `/whoami` - Show your user information
-
-**Conversation:**
-- `/clear` - Clear conversation history
-- `/history` - Show conversation history stats
-
-**Model Selection:**
-- `/model` - Show current model
-- `/model <provider>` - Switch to a provider (anthropic, openai, gemini, ollama)
-- `/model <provider> <model>` - Switch to specific model
-- `/providers` - List available providers
-
-**Examples:**
-- `/model anthropic` - Use Claude
-- `/model openai gpt-4o` - Use GPT-4o
-- `/model ollama llama3.1:8b` - Use local Llama
-
-Just send a message to chat with the AI assistant!
-"""
+        return _HELP_TEXT
 
     async def _cmd_status(self, **kwargs: Any) -> str:
         """Show bot status."""
         settings = self._settings
-        available = settings.get_available_providers()
+        history_stats = self._history.get_stats()
 
         status_lines = [
             "**Bot Status**",
@@ -152,21 +202,18 @@ Just send a message to chat with the AI assistant!
             "",
             "**Available Providers:**",
         ]
-
-        for provider in available:
-            config = settings.get_provider_config(provider)
-            status_lines.append(f"- `{provider.value}`: {config.model}")
-
-        # Add history stats
-        history_stats = self._history.get_stats()
-        status_lines.extend([
+        provider_lines = [
+            f"- `{provider.value}`: {settings.get_provider_config(provider).model}"
+            for provider in settings.get_available_providers()
+        ]
+        history_lines = [
             "",
             "**Conversation Stats:**",
             f"- Active Rooms: {history_stats['total_rooms']}",
             f"- Total Messages: {history_stats['total_messages']}",
-        ])
+        ]
 
-        return "\n".join(status_lines)
+        return "\n".join(status_lines + provider_lines + history_lines)
 
     async def _cmd_clear(self, room_id: str, **kwargs: Any) -> str:
         """Clear conversation history."""
@@ -215,16 +262,16 @@ Just send a message to chat with the AI assistant!
 
         # Validate provider
         try:
-            provider = LLMProvider(provider_name)
+            provider = coerce_provider(provider_name)
         except ValueError:
-            available = ", ".join(p.value for p in LLMProvider)
-            return f"Unknown provider: `{provider_name}`\n\nAvailable: {available}"
+            return f"Unknown provider: `{provider_name}`\n\nAvailable: {_PROVIDER_VALUES_JOINED}"
 
-        if provider not in self._settings.get_available_providers():
+        if not self._settings.is_provider_available(provider):
             return f"Provider `{provider_name}` is not configured."
 
-        # Set the provider for this conversation
-        self._history.set_provider(room_id, provider_name)
+        # Set the provider for this conversation (reusing the context above)
+        if context is not None:
+            self._history.set_provider(context, provider_name)
 
         response = f"Switched to `{provider_name}`"
         if model_name:
@@ -234,11 +281,18 @@ Just send a message to chat with the AI assistant!
 
     async def _cmd_providers(self, **kwargs: Any) -> str:
         """List available providers."""
+        # Output depends only on the (immutable) settings, so render it once
+        if self._providers_text is None:
+            self._providers_text = self._render_providers()
+        return self._providers_text
+
+    def _render_providers(self) -> str:
+        """Render the provider list for /providers."""
         available = self._settings.get_available_providers()
 
         lines = ["**Available LLM Providers:**", ""]
 
-        for provider in LLMProvider:
+        for provider in _ALL_PROVIDERS:
             config = self._settings.get_provider_config(provider)
             if provider in available:
                 status = "configured"
@@ -251,24 +305,14 @@ Just send a message to chat with the AI assistant!
     async def _cmd_whoami(self, user_email: str, **kwargs: Any) -> str:
         """Show user information."""
         info = self._users.get_user_info(user_email)
-
-        lines = [
-            "**Your Information:**",
-            "",
-            f"- Email: `{info['email']}`",
-            f"- Authorized: `{info['authorized']}`",
-        ]
-
-        if info.get("display_name"):
-            lines.append(f"- Display Name: {info['display_name']}")
-        if info.get("provider"):
-            lines.append(f"- Preferred Provider: `{info['provider']}`")
-        if info.get("model"):
-            lines.append(f"- Preferred Model: `{info['model']}`")
-        if info.get("is_admin"):
-            lines.append("- Role: **Admin**")
-
-        return "\n".join(lines)
+        return _render_whoami(
+            info["email"],
+            info["authorized"],
+            info.get("display_name"),
+            info.get("provider"),
+            info.get("model"),
+            info.get("is_admin", False),
+        )
 
     async def _cmd_history(self, room_id: str, **kwargs: Any) -> str:
         """Show conversation history stats."""
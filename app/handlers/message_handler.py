@@ -1,21 +1,26 @@
 """Handler for natural language messages."""
 
-import asyncio
-from typing import Any
+import re
+import time
 
 from app.config import get_settings
 from app.core.exceptions import LLMError
 from app.core.logging import get_logger, LogEvents
 from app.handlers.command_handler import CommandHandler
+from app.models.llm import FormattedHistory
 from app.models.webex import WebexMessage
 from app.services.history_service import HistoryService
 from app.services.llm_service import LLMService
+from app.services.response_cache import ResponseCache
 from app.services.user_service import UserService
 from app.services.webex_service import WebexService
-from app.utils.markdown_detector import should_use_markdown
+from app.utils.markdown_detector import MarkdownDetector, should_use_markdown
 
 logger = get_logger("message_handler")
 
+# Leading mention patterns, e.g. "@BotName" or "BotName:"
+_BOT_MENTION_RE = re.compile(r"^@?\w+:\s*")
+
 
 class MessageHandler:
     """Handler for processing user messages."""
@@ -27,13 +32,16 @@ class MessageHandler:
         history_service: HistoryService,
         llm_service: LLMService,
         command_handler: CommandHandler,
+        response_cache: ResponseCache | None = None,
     ) -> None:
         self._webex = webex_service
         self._users = user_service
         self._history = history_service
         self._llm = llm_service
         self._commands = command_handler
+        self._response_cache = response_cache
         self._settings = get_settings()
+        self._bot_email: str | None = None
 
     async def handle(self, message: WebexMessage) -> None:
         """
@@ -62,13 +70,13 @@ class MessageHandler:
             logger.debug("empty_message_ignored")
             return
 
-        # Check for commands
-        if self._commands.is_command(content):
-            response = await self._commands.handle(
-                text=content,
-                user_email=user_email,
-                room_id=room_id,
-            )
+        # Commands are parsed once; handle() returns None for anything else
+        response = await self._commands.handle(
+            text=content,
+            user_email=user_email,
+            room_id=room_id,
+        )
+        if response is not None:
             if response:
                 await self._webex.send_message(
                     room_id=room_id,
@@ -85,16 +93,17 @@ class MessageHandler:
 
     def _strip_bot_mention(self, content: str) -> str:
         """Remove bot mention from message content."""
-        bot_email = self._webex.bot_email
+        bot_email = self._bot_email
+        if bot_email is None:
+            # Resolved on first message; the bot identity never changes
+            bot_email = self._bot_email = self._webex.bot_email
 
         # Remove email mention
         if bot_email in content:
             content = content.replace(bot_email, "").strip()
 
         # Remove common mention patterns
-        # e.g., "@BotName" or "BotName:"
-        import re
-        content = re.sub(r"^@?\w+:\s*", "", content)
+        content = _BOT_MENTION_RE.sub("", content, count=1)
 
         return content.strip()
 
@@ -118,16 +127,15 @@ class MessageHandler:
         if context and context.provider_used:
             provider = context.provider_used
 
-        # Get conversation history
-        history = self._history.get_messages_for_llm(room_id)
-
-        # Add user message to history
+        # Add user message to history, then fetch the LLM payload once with
+        # the current turn already at the end
         self._history.add_message(
             room_id=room_id,
             user_email=user_email,
             role="user",
             content=content,
         )
+        history = self._history.get_formatted_history(room_id, include_current=True)
 
         # Check if we should stream
         should_stream = user_config.preferences.streaming
@@ -188,25 +196,44 @@ class MessageHandler:
         self,
         content: str,
         system_prompt: str,
-        history: list[dict[str, Any]],
+        history: FormattedHistory,
         provider: str | None,
         model: str | None,
     ) -> str:
-        """Get a non-streaming response from the LLM."""
+        """Get a non-streaming response from the LLM (served from cache if possible)."""
+        cache = self._response_cache
+        cache_key = None
+        if cache is not None and cache.enabled:
+            cache_key = cache.make_key(provider, model, system_prompt, history, content)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         response = await self._llm.chat(
-            message=content,
+            message=None,
             system_prompt=system_prompt,
             history=history,
             provider_name=provider,
             model=model,
         )
+
+        # Only cache complete answers, not truncated or errored ones, and not
+        # answers built from tool output, which can go stale
+        if (
+            cache is not None
+            and cache_key is not None
+            and response.finish_reason == "stop"
+            and not response.used_tools
+        ):
+            cache.put(cache_key, response.content)
+
         return response.content
 
     async def _stream_response(
         self,
         content: str,
         system_prompt: str,
-        history: list[dict[str, Any]],
+        history: FormattedHistory,
         provider: str | None,
         model: str | None,
         room_id: str,
@@ -220,11 +247,14 @@ class MessageHandler:
 
         accumulated_text = ""
         last_update_time = 0.0
-        update_interval = 1.0  # Update every second
+        last_update_len = 0
+        update_interval = 1.0  # Update at most every second
+        min_delta_chars = self._settings.stream_min_delta_chars
+        markdown_detector = MarkdownDetector()
 
         try:
             async for chunk in self._llm.stream(
-                message=content,
+                message=None,
                 system_prompt=system_prompt,
                 history=history,
                 provider_name=provider,
@@ -233,10 +263,14 @@ class MessageHandler:
                 if chunk.content:
                     accumulated_text += chunk.content
 
-                    # Throttle updates to avoid rate limiting
-                    current_time = asyncio.get_event_loop().time()
-                    if current_time - last_update_time >= update_interval:
-                        use_markdown = should_use_markdown(accumulated_text)
+                    # Throttle updates to avoid rate limiting: wait for both
+                    # the interval to pass and enough new text to show
+                    current_time = time.monotonic()
+                    if (
+                        current_time - last_update_time >= update_interval
+                        and len(accumulated_text) - last_update_len >= min_delta_chars
+                    ):
+                        use_markdown = markdown_detector.update(accumulated_text)
                         if use_markdown:
                             await self._webex.update_message(
                                 message_id=initial_msg_id,
@@ -250,13 +284,17 @@ class MessageHandler:
                                 text=accumulated_text + "...",
                             )
                         last_update_time = current_time
+                        last_update_len = len(accumulated_text)
 
                 if chunk.done:
                     break
 
             # Final update with complete response
             if accumulated_text:
-                use_markdown = should_use_markdown(accumulated_text)
+                # Full check only if the incremental one hasn't already decided
+                use_markdown = markdown_detector.is_markdown or should_use_markdown(
+                    accumulated_text
+                )
                 if use_markdown:
                     await self._webex.update_message(
                         message_id=initial_msg_id,
@@ -2,21 +2,29 @@
 
 import hashlib
 import hmac
-import uuid
+import os
+import re
 from typing import Any
 
 from fastapi import HTTPException, Request
 import structlog
 
 from app.config import get_settings
+from app.core.json_utils import json_loads
 from app.core.logging import get_logger, LogEvents
 from app.handlers.message_handler import MessageHandler
-from app.models.webex import WebhookPayload
 from app.services.user_service import UserService
 from app.services.webex_service import WebexService
 
 logger = get_logger("webhook_handler")
 
+# Webex notifications are a few KB; anything far larger is not from Webex
+_MAX_BODY_BYTES = 1024 * 1024
+
+# Raw-body probes for a messages:created notification, tolerant of JSON spacing
+_MESSAGES_RESOURCE = re.compile(rb'"resource"\s*:\s*"messages"')
+_CREATED_EVENT = re.compile(rb'"event"\s*:\s*"created"')
+
 
 class WebhookHandler:
     """Handles incoming webhooks from Webex."""
@@ -31,12 +39,34 @@ class WebhookHandler:
         self._users = user_service
         self._messages = message_handler
         self._settings = get_settings()
+        # Encoded once; empty bytes means signature checks are disabled
+        self._secret_bytes = (self._settings.webex_webhook_secret or "").encode("utf-8")
 
-    def _validate_signature(self, body: bytes, signature: str | None) -> bool:
-        """Validate webhook signature using HMAC-SHA1."""
-        secret = self._settings.webex_webhook_secret
+    async def _read_body(self, request: Request) -> tuple[bytes, bytes | None]:
+        """Read the request body, computing its HMAC-SHA1 as chunks arrive.
+
+        Returns:
+            The body and its digest (None when no secret is configured)
 
-        if not secret:
+        Raises:
+            HTTPException: If the body exceeds the size cap
+        """
+        mac = hmac.new(self._secret_bytes, digestmod=hashlib.sha1) if self._secret_bytes else None
+        chunks: list[bytes] = []
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > _MAX_BODY_BYTES:
+                logger.warning("webhook_body_too_large", size=size)
+                raise HTTPException(status_code=413, detail="Payload too large")
+            if mac is not None:
+                mac.update(chunk)
+            chunks.append(chunk)
+        return b"".join(chunks), mac.digest() if mac is not None else None
+
+    def _validate_signature(self, expected: bytes | None, signature: str | None) -> bool:
+        """Validate webhook signature against the body's HMAC-SHA1 digest."""
+        if expected is None:
             logger.debug("webhook_signature_check_skipped", reason="no_secret")
             return True
 
@@ -47,15 +77,12 @@ class WebhookHandler:
             )
             return False
 
-        # Calculate expected signature
-        expected = hmac.new(
-            key=secret.encode("utf-8"),
-            msg=body,
-            digestmod=hashlib.sha1,
-        ).hexdigest()
-
-        # Secure comparison
-        if not hmac.compare_digest(signature, expected):
+        # Secure comparison on the raw digest bytes
+        try:
+            provided = bytes.fromhex(signature)
+        except ValueError:
+            provided = b""
+        if not hmac.compare_digest(provided, expected):
             logger.warning(
                 LogEvents.WEBHOOK_VALIDATION_FAILED,
                 reason="invalid_signature",
@@ -79,60 +106,80 @@ class WebhookHandler:
             HTTPException: For validation errors
         """
         # Generate request ID for tracing
-        request_id = str(uuid.uuid4())[:8]
+        request_id = os.urandom(4).hex()
 
-        # Bind context for logging
-        structlog.contextvars.clear_contextvars()
-        structlog.contextvars.bind_contextvars(request_id=request_id)
+        # Bind context for logging; resetting the tokens afterwards restores
+        # the previous context in O(1) instead of clearing it up front
+        tokens = structlog.contextvars.bind_contextvars(request_id=request_id)
+        try:
+            return await self._process(request)
+        finally:
+            structlog.contextvars.reset_contextvars(**tokens)
 
-        # Read and validate body
-        body = await request.body()
+    async def _process(self, request: Request) -> dict[str, Any]:
+        """Validate, parse and dispatch a webhook (logging context already bound)."""
+        # Read body, hashing it in the same pass
+        body, digest = await self._read_body(request)
 
         # Validate signature
         signature = request.headers.get("X-Spark-Signature")
-        if not self._validate_signature(body, signature):
+        if not self._validate_signature(digest, signature):
             raise HTTPException(status_code=401, detail="Invalid signature")
 
-        # Parse payload
+        # Cheap pre-filter on the raw bytes so other notifications (memberships,
+        # rooms, ...) skip JSON parsing entirely
+        if _MESSAGES_RESOURCE.search(body) is None or _CREATED_EVENT.search(body) is None:
+            logger.info(LogEvents.WEBHOOK_RECEIVED, body_bytes=len(body))
+            logger.debug("webhook_ignored", reason="not_message_created")
+            return {"status": "ignored", "reason": "not_message_created"}
+
+        # Parse payload, reading only the fields we route on rather than
+        # validating the full WebhookPayload model on every webhook
         try:
-            payload = WebhookPayload.model_validate_json(body)
-        except Exception as e:
+            raw = json_loads(body)
+            resource = raw["resource"]
+            event = raw["event"]
+            data = raw["data"]
+            person_email = data["personEmail"]
+            room_id = data["roomId"]
+            message_id = data["id"]
+        except (ValueError, KeyError, TypeError) as e:
             logger.error("webhook_parse_error", error=str(e))
             raise HTTPException(status_code=400, detail="Invalid payload") from e
 
         logger.info(
             LogEvents.WEBHOOK_RECEIVED,
-            webhook_id=payload.id,
-            resource=payload.resource.value,
-            webhook_event=payload.event.value,
-            actor_email=payload.data.person_email,
+            webhook_id=raw.get("id"),
+            resource=resource,
+            webhook_event=event,
+            actor_email=person_email,
         )
 
         # Only process message:created events
-        if payload.resource.value != "messages" or payload.event.value != "created":
+        if resource != "messages" or event != "created":
             logger.debug("webhook_ignored", reason="not_message_created")
             return {"status": "ignored", "reason": "not_message_created"}
 
         # Ignore messages from self
-        if self._webex.is_from_self(payload.data.person_email):
+        if self._webex.is_from_self(person_email):
             logger.debug(LogEvents.MESSAGE_FROM_SELF)
             return {"status": "ignored", "reason": "from_self"}
 
         # Check user authorization
-        if not self._users.is_authorized(payload.data.person_email):
+        if not self._users.is_authorized(person_email):
             logger.warning(
                 LogEvents.USER_NOT_WHITELISTED,
-                email=payload.data.person_email,
+                email=person_email,
             )
             await self._webex.send_message(
-                room_id=payload.data.room_id,
+                room_id=room_id,
                 text="Sorry, you are not authorized to use this bot. Please contact an administrator.",
             )
             return {"status": "unauthorized"}
 
         # Fetch full message content
         try:
-            message = await self._webex.get_message(payload.data.id)
+            message = await self._webex.get_message(message_id)
         except Exception as e:
             logger.error("message_fetch_failed", error=str(e))
             return {"status": "error", "error": "Failed to fetch message"}
@@ -140,8 +187,8 @@ class WebhookHandler:
         # Process the message
         try:
             await self._messages.handle(message)
-            logger.info(LogEvents.WEBHOOK_PROCESSED, message_id=payload.data.id)
-            return {"status": "processed", "message_id": payload.data.id}
+            logger.info(LogEvents.WEBHOOK_PROCESSED, message_id=message_id)
+            return {"status": "processed", "message_id": message_id}
         except Exception as e:
             logger.error("message_processing_failed", error=str(e))
             return {"status": "error", "error": str(e)}
@@ -4,8 +4,7 @@ from contextlib import asynccontextmanager
 from typing import Any, AsyncIterator
 
 from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app import __version__
 from app.config import get_settings
@@ -13,12 +12,22 @@ from app.core.logging import get_logger, setup_logging, LogEvents
 from app.handlers.command_handler import CommandHandler
 from app.handlers.message_handler import MessageHandler
 from app.handlers.webhook_handler import WebhookHandler, verify_webhook_setup
+from app.providers.anthropic import close_clients as close_anthropic_clients
+from app.providers.openai import close_clients as close_openai_clients
 from app.services.history_service import HistoryService
 from app.services.llm_service import LLMService
 from app.services.mcp_service import MCPService
+from app.services.response_cache import ResponseCache
 from app.services.user_service import UserService
 from app.services.webex_service import WebexService
 
+try:
+    import orjson  # noqa: F401  (optional, faster JSON encoding)
+except ImportError:
+    DefaultResponse: type[JSONResponse] = JSONResponse
+else:
+    DefaultResponse = ORJSONResponse
+
 # Initialize logging early
 setup_logging()
 logger = get_logger("main")
@@ -28,14 +37,29 @@ logger = get_logger("main")
 class AppState:
     """Application state container."""
 
+    __slots__ = (
+        "webex_service",
+        "user_service",
+        "history_service",
+        "mcp_service",
+        "llm_service",
+        "response_cache",
+        "command_handler",
+        "message_handler",
+        "webhook_handler",
+        "static_health",
+    )
+
     webex_service: WebexService
     user_service: UserService
     history_service: HistoryService
     mcp_service: MCPService
     llm_service: LLMService
+    response_cache: ResponseCache
     command_handler: CommandHandler
     message_handler: MessageHandler
     webhook_handler: WebhookHandler
+    static_health: dict[str, Any]  # /health fields fixed for the process lifetime
 
 
 app_state = AppState()
@@ -59,6 +83,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     app_state.history_service = HistoryService()
     app_state.mcp_service = MCPService()
     app_state.llm_service = LLMService(mcp_service=app_state.mcp_service)
+    app_state.response_cache = ResponseCache()
 
     # Initialize handlers
     app_state.command_handler = CommandHandler(
@@ -71,6 +96,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         history_service=app_state.history_service,
         llm_service=app_state.llm_service,
         command_handler=app_state.command_handler,
+        response_cache=app_state.response_cache,
     )
     app_state.webhook_handler = WebhookHandler(
         webex_service=app_state.webex_service,
@@ -84,9 +110,19 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except Exception as e:
         logger.warning("mcp_initialization_failed", error=str(e))
 
+    available_providers = [p.value for p in settings.get_available_providers()]
+    app_state.static_health = {
+        "version": __version__,
+        "environment": settings.app_env.value,
+        "providers": {
+            "available": available_providers,
+            "default": settings.default_llm_provider.value,
+        },
+    }
+
     logger.info(
         LogEvents.APP_STARTED,
-        available_providers=[p.value for p in settings.get_available_providers()],
+        available_providers=available_providers,
         mcp_enabled=settings.mcp_enabled,
     )
 
@@ -96,6 +132,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info(LogEvents.APP_SHUTDOWN)
     app_state.webex_service.cleanup()
     await app_state.mcp_service.close()
+    await close_anthropic_clients()
+    await close_openai_clients()
 
 
 # Create FastAPI app
@@ -104,15 +142,7 @@ app = FastAPI(
     description="AI assistant for presales engineers via Webex Teams",
     version=__version__,
     lifespan=lifespan,
-)
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    default_response_class=DefaultResponse,
 )
 
 
@@ -130,8 +160,6 @@ async def root() -> dict[str, Any]:
 @app.get("/health")
 async def health_check() -> dict[str, Any]:
     """Health check endpoint."""
-    settings = get_settings()
-
     # Check webex connection
     webex_status = await verify_webhook_setup(app_state.webex_service)
 
@@ -143,14 +171,9 @@ async def health_check() -> dict[str, Any]:
 
     return {
         "status": "healthy",
-        "version": __version__,
-        "environment": settings.app_env.value,
+        **app_state.static_health,
         "webex": webex_status,
-        "mcp": {"enabled": settings.mcp_enabled, "healthy": mcp_healthy},
-        "providers": {
-            "available": [p.value for p in settings.get_available_providers()],
-            "default": settings.default_llm_provider.value,
-        },
+        "mcp": {"enabled": app_state.mcp_service.is_enabled, "healthy": mcp_healthy},
         "conversations": history_stats,
     }
 
@@ -167,10 +190,8 @@ async def webhook(request: Request) -> dict[str, Any]:
     return await app_state.webhook_handler.handle(request)
 
 
-@app.post("/webhooks/messages")
-async def webhook_messages(request: Request) -> dict[str, Any]:
-    """Alternative webhook endpoint for messages."""
-    return await app_state.webhook_handler.handle(request)
+# Alternative path for message webhooks (same handler, kept out of the schema)
+app.add_api_route("/webhooks/messages", webhook, methods=["POST"], include_in_schema=False)
 
 
 @app.get("/stats")
@@ -186,6 +207,7 @@ async def stats() -> dict[str, Any]:
             "count": len(app_state.mcp_service.get_tools()),
             "enabled": app_state.mcp_service.is_enabled,
         },
+        "response_cache": app_state.response_cache.get_stats(),
     }
 
 
@@ -226,7 +248,7 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
         error=str(exc),
         exc_info=True,
     )
-    return JSONResponse(
+    return DefaultResponse(
         status_code=500,
         content={"error": "Internal server error"},
     )
@@ -1,7 +1,7 @@
 """Data models for the application."""
 
 from app.models.webex import WebhookData, WebhookEvent, WebhookPayload, WebhookResource, WebexMessage
-from app.models.llm import ChatMessage, LLMResponse, MessageRole, StreamChunk, TokenUsage, ToolCall, ToolResult
+from app.models.llm import ChatMessage, FormattedHistory, LLMResponse, MessageRole, StreamChunk, TokenUsage, ToolCall, ToolResult
 from app.models.tools import Tool
 from app.models.user import ConversationContext, UserConfig, UserPreferences
 
@@ -14,6 +14,7 @@ __all__ = [
     "WebexMessage",
     # LLM models
     "ChatMessage",
+    "FormattedHistory",
     "LLMResponse",
     "MessageRole",
     "StreamChunk",
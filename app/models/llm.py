@@ -1,9 +1,13 @@
 """LLM request and response models."""
 
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from functools import cached_property
+from typing import Any, NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MessageRole(str, Enum):
@@ -40,8 +44,28 @@ class ChatMessage(BaseModel):
     tool_call_id: str | None = None
     name: str | None = None  # For tool results
 
+    # Frozen so the per-provider conversions below can be cached safely
+    model_config = ConfigDict(frozen=True)
+
     def to_anthropic_format(self) -> dict[str, Any]:
-        """Convert to Anthropic message format."""
+        """Convert to Anthropic message format (cached; do not mutate)."""
+        return self._anthropic_format
+
+    def to_openai_format(self) -> dict[str, Any]:
+        """Convert to OpenAI message format (cached; do not mutate)."""
+        return self._openai_format
+
+    def to_gemini_format(self) -> dict[str, Any]:
+        """Convert to Gemini message format (cached; do not mutate)."""
+        return self._gemini_format
+
+    def to_ollama_format(self) -> dict[str, Any]:
+        """Convert to Ollama message format (OpenAI-compatible)."""
+        return self.to_openai_format()
+
+    @cached_property
+    def _anthropic_format(self) -> dict[str, Any]:
+        """Build the Anthropic message format."""
         if self.role == MessageRole.SYSTEM:
             # Anthropic handles system messages separately
             return {"role": "user", "content": f"[System]: {self.content}"}
@@ -75,8 +99,9 @@ class ChatMessage(BaseModel):
 
         return {"role": self.role.value, "content": self.content}
 
-    def to_openai_format(self) -> dict[str, Any]:
-        """Convert to OpenAI message format."""
+    @cached_property
+    def _openai_format(self) -> dict[str, Any]:
+        """Build the OpenAI message format."""
         if self.role == MessageRole.SYSTEM:
             return {"role": "system", "content": self.content}
 
@@ -97,7 +122,7 @@ class ChatMessage(BaseModel):
                         "type": "function",
                         "function": {
                             "name": tc.name,
-                            "arguments": str(tc.arguments),
+                            "arguments": json.dumps(tc.arguments),
                         },
                     }
                     for tc in self.tool_calls
@@ -106,8 +131,9 @@ class ChatMessage(BaseModel):
 
         return {"role": self.role.value, "content": self.content}
 
-    def to_gemini_format(self) -> dict[str, Any]:
-        """Convert to Gemini message format."""
+    @cached_property
+    def _gemini_format(self) -> dict[str, Any]:
+        """Build the Gemini message format."""
         if self.role == MessageRole.SYSTEM:
             return {"role": "user", "parts": [{"text": f"[System]: {self.content}"}]}
 
@@ -137,9 +163,44 @@ class ChatMessage(BaseModel):
         role = "model" if self.role == MessageRole.ASSISTANT else "user"
         return {"role": role, "parts": [{"text": self.content}]}
 
-    def to_ollama_format(self) -> dict[str, Any]:
-        """Convert to Ollama message format (OpenAI-compatible)."""
-        return self.to_openai_format()
+
+def to_anthropic(message: ChatMessage) -> dict[str, Any]:
+    """Convert a message to Anthropic format (cached; do not mutate)."""
+    return message._anthropic_format
+
+
+def to_openai(message: ChatMessage) -> dict[str, Any]:
+    """Convert a message to OpenAI format (cached; do not mutate)."""
+    return message._openai_format
+
+
+def to_gemini(message: ChatMessage) -> dict[str, Any]:
+    """Convert a message to Gemini format (cached; do not mutate)."""
+    return message._gemini_format
+
+
+# Message converters by provider name (Ollama uses the OpenAI format)
+FORMATTERS: dict[str, Callable[[ChatMessage], dict[str, Any]]] = {
+    "anthropic": to_anthropic,
+    "openai": to_openai,
+    "gemini": to_gemini,
+    "ollama": to_openai,
+}
+
+
+@dataclass(slots=True)
+class FormattedHistory:
+    """Conversation history already converted to ChatMessage objects.
+
+    The messages are shared with the stored conversation, so their cached
+    provider formats carry over from one turn to the next.
+
+    ``stable_prefix`` counts the leading messages that stay identical on
+    every later turn, so providers can mark them for prompt caching.
+    """
+
+    messages: list[ChatMessage]
+    stable_prefix: int = 0
 
 
 class TokenUsage(BaseModel):
@@ -178,10 +239,16 @@ class LLMResponse(BaseModel):
     usage: TokenUsage | None = None
     model: str
     provider: str
+    # Set by LLMService when tools were run to produce this answer
+    used_tools: bool = False
+
 
+class StreamChunk(NamedTuple):
+    """Streaming chunk from LLM (provider-agnostic).
 
-class StreamChunk(BaseModel):
-    """Streaming chunk from LLM (provider-agnostic)."""
+    A plain NamedTuple rather than a pydantic model: one is built per
+    streamed token and the values come from our own provider adapters.
+    """
 
     content: str | None = None
     tool_calls: list[ToolCall] | None = None
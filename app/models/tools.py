@@ -1,27 +1,107 @@
 """Tool/function calling models."""
 
-from typing import Any
+import json
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Any, ClassVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+
+def _convert_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Convert JSON Schema to Gemini's expected format.
+
+    Walks the schema with an explicit stack instead of recursing, filling
+    each converted node into its parent's slot.
+    """
+    # Gemini uses a subset of JSON Schema
+    root: dict[str, Any] = {}
+    stack: list[tuple[dict[str, Any], dict[str, Any], str]] = [(schema, root, "")]
+
+    while stack:
+        node, parent, slot = stack.pop()
+        converted: dict[str, Any] = {}
+        parent[slot] = converted
+
+        for key, value in node.items():
+            if key == "type":
+                converted["type"] = value.upper()
+            elif key == "properties":
+                # Pre-seed the slots so properties keep their source order
+                properties: dict[str, Any] = dict.fromkeys(value)
+                converted["properties"] = properties
+                for name, child in value.items():
+                    stack.append((child, properties, name))
+            elif key == "items":
+                stack.append((value, converted, "items"))
+            elif key in ("required", "description", "enum"):
+                converted[key] = value
+
+    return root[""]
+
+
+# Larger schemas are converted without caching so they aren't pinned in memory
+_MAX_CACHED_SCHEMA_CHARS = 1024
+
+
+@lru_cache(maxsize=512)
+def _convert_schema_json(schema_json: str) -> dict[str, Any]:
+    """Convert a JSON-encoded schema, cached so identical schemas convert once."""
+    return _convert_schema(json.loads(schema_json))
+
+
+def convert_schema_for_gemini(schema: dict[str, Any]) -> dict[str, Any]:
+    """Convert JSON Schema to Gemini's expected format (memoized).
+
+    The result is shared between callers and must not be mutated.
+    """
+    # Keys stay in insertion order: Gemini presents properties in the order
+    # given, so schemas that differ only in key order are cached separately
+    schema_json = json.dumps(schema)
+    if len(schema_json) > _MAX_CACHED_SCHEMA_CHARS:
+        return _convert_schema(schema)
+    return _convert_schema_json(schema_json)
 
 
 class Tool(BaseModel):
     """Unified tool definition (provider-agnostic)."""
 
+    # Frozen so the cached provider formats below can't go stale
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     parameters: dict[str, Any]  # JSON Schema format
 
     def to_anthropic_format(self) -> dict[str, Any]:
         """Convert to Anthropic tool format."""
+        return self._anthropic_format
+
+    def to_openai_format(self) -> dict[str, Any]:
+        """Convert to OpenAI tool format."""
+        return self._openai_format
+
+    def to_gemini_format(self) -> dict[str, Any]:
+        """Convert to Gemini tool format."""
+        return self._gemini_format
+
+    def to_ollama_format(self) -> dict[str, Any]:
+        """Convert to Ollama tool format (OpenAI-compatible)."""
+        return self.to_openai_format()
+
+    # Each provider format is built once per tool and reused for every request
+
+    @cached_property
+    def _anthropic_format(self) -> dict[str, Any]:
         return {
             "name": self.name,
             "description": self.description,
             "input_schema": self.parameters,
         }
 
-    def to_openai_format(self) -> dict[str, Any]:
-        """Convert to OpenAI tool format."""
+    @cached_property
+    def _openai_format(self) -> dict[str, Any]:
         return {
             "type": "function",
             "function": {
@@ -31,56 +111,41 @@ class Tool(BaseModel):
             },
         }
 
-    def to_gemini_format(self) -> dict[str, Any]:
-        """Convert to Gemini tool format."""
+    @cached_property
+    def _gemini_format(self) -> dict[str, Any]:
         # Convert JSON Schema to Gemini's format
         return {
             "name": self.name,
             "description": self.description,
-            "parameters": self._convert_schema_for_gemini(self.parameters),
+            "parameters": convert_schema_for_gemini(self.parameters),
         }
 
-    def to_ollama_format(self) -> dict[str, Any]:
-        """Convert to Ollama tool format (OpenAI-compatible)."""
-        return self.to_openai_format()
-
-    def _convert_schema_for_gemini(self, schema: dict[str, Any]) -> dict[str, Any]:
-        """Convert JSON Schema to Gemini's expected format."""
-        # Gemini uses a subset of JSON Schema
-        converted: dict[str, Any] = {}
-
-        if "type" in schema:
-            converted["type"] = schema["type"].upper()
-
-        if "properties" in schema:
-            converted["properties"] = {
-                k: self._convert_schema_for_gemini(v)
-                for k, v in schema["properties"].items()
-            }
-
-        if "required" in schema:
-            converted["required"] = schema["required"]
 
-        if "description" in schema:
-            converted["description"] = schema["description"]
+@dataclass(slots=True)
+class ToolRegistry:
+    """Registry of available tools.
 
-        if "items" in schema:
-            converted["items"] = self._convert_schema_for_gemini(schema["items"])
+    A plain dataclass: it holds already-validated Tools, so there is nothing
+    for pydantic to validate.
+    """
 
-        if "enum" in schema:
-            converted["enum"] = schema["enum"]
+    # Tool converters by provider name
+    PROVIDER_FORMATTERS: ClassVar[dict[str, Callable[[Tool], dict[str, Any]]]] = {
+        "anthropic": Tool.to_anthropic_format,
+        "openai": Tool.to_openai_format,
+        "gemini": Tool.to_gemini_format,
+        "ollama": Tool.to_ollama_format,
+    }
 
-        return converted
-
-
-class ToolRegistry(BaseModel):
-    """Registry of available tools."""
-
-    tools: dict[str, Tool] = {}
+    tools: dict[str, Tool] = field(default_factory=dict)
+    _format_cache: dict[str, list[dict[str, Any]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self.tools[tool.name] = tool
+        self._format_cache.clear()
 
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
@@ -91,15 +156,18 @@ class ToolRegistry(BaseModel):
         return list(self.tools.values())
 
     def to_provider_format(self, provider: str) -> list[dict[str, Any]]:
-        """Convert all tools to a specific provider's format."""
-        converter = {
-            "anthropic": lambda t: t.to_anthropic_format(),
-            "openai": lambda t: t.to_openai_format(),
-            "gemini": lambda t: t.to_gemini_format(),
-            "ollama": lambda t: t.to_ollama_format(),
-        }.get(provider)
-
-        if not converter:
+        """Convert all tools to a specific provider's format.
+
+        The list is cached per provider until the next register().
+        """
+        cached = self._format_cache.get(provider)
+        if cached is not None:
+            return cached
+
+        converter = self.PROVIDER_FORMATTERS.get(provider)
+        if converter is None:
             raise ValueError(f"Unknown provider: {provider}")
 
-        return [converter(tool) for tool in self.tools.values()]
+        formatted = [converter(tool) for tool in self.tools.values()]
+        self._format_cache[provider] = formatted
+        return formatted
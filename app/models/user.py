@@ -1,8 +1,32 @@
 """User and conversation models."""
 
+import time
+from collections.abc import Iterator
 from datetime import datetime, timezone
+from itertools import chain, islice
+from typing import Any, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field, field_validator
+
+from app.models.llm import ChatMessage, FormattedHistory, MessageRole
+
+_T = TypeVar("_T")
+
+
+def _iter_window(items: list[_T], max_items: int, stable_prefix: int = 0) -> Iterator[_T]:
+    """Iterate the last ``max_items`` items, keeping a stable prefix."""
+    count = len(items)
+    if count > max_items and 0 < stable_prefix < max_items:
+        return chain(
+            islice(items, stable_prefix),
+            islice(items, count - max_items + stable_prefix, None),
+        )
+    return islice(items, max(0, count - max_items), None)
+
+
+def _window(items: list[_T], max_items: int, stable_prefix: int = 0) -> list[_T]:
+    """Return (a copy of) the last ``max_items`` items, keeping a stable prefix."""
+    return list(_iter_window(items, max_items, stable_prefix))
 
 
 class UserPreferences(BaseModel):
@@ -17,6 +41,9 @@ class UserPreferences(BaseModel):
 class UserConfig(BaseModel):
     """Configuration for an authorized user."""
 
+    # Frozen so UsersConfig's lookup table can't go stale
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = True
     display_name: str | None = None
     provider: str | None = None  # anthropic, openai, gemini, ollama
@@ -31,39 +58,90 @@ class ConversationContext(BaseModel):
 
     room_id: str
     user_email: str
-    messages: list[dict] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    last_updated: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Epoch nanoseconds; cheaper to stamp on every message than a datetime
+    last_updated_ns: int = Field(default_factory=time.time_ns)
     message_count: int = 0
     provider_used: str | None = None  # Track provider for this conversation
 
+    # History is kept as parallel lists rather than one dict per message.
+    # The ChatMessage list is what the LLM needs (each message is converted
+    # once, not on every turn); timestamps live alongside it.
+    _chat_messages: list[ChatMessage] = PrivateAttr(default_factory=list)
+    _timestamps: list[int] = PrivateAttr(default_factory=list)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def last_updated(self) -> datetime:
+        """When the conversation last changed."""
+        return datetime.fromtimestamp(self.last_updated_ns / 1e9, timezone.utc)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def messages(self) -> list[dict]:
+        """All messages as dicts (timestamps in epoch nanoseconds)."""
+        return [
+            {"role": m.role.value, "content": m.content, "timestamp": ts}
+            for m, ts in zip(self._chat_messages, self._timestamps, strict=True)
+        ]
+
     def add_message(self, role: str, content: str) -> None:
         """Add a message to the conversation."""
-        self.messages.append(
-            {
-                "role": role,
-                "content": content,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-        )
+        now_ns = time.time_ns()
+        self._chat_messages.append(ChatMessage(role=MessageRole(role), content=content))
+        self._timestamps.append(now_ns)
         self.message_count += 1
-        self.last_updated = datetime.now(timezone.utc)
-
-    def get_messages_for_llm(self, max_messages: int = 20) -> list[dict]:
-        """Get recent messages formatted for LLM context."""
-        # Return most recent messages, respecting the limit
-        recent = self.messages[-max_messages:] if len(self.messages) > max_messages else self.messages
-        return [{"role": m["role"], "content": m["content"]} for m in recent]
+        self.last_updated_ns = now_ns
+
+    def get_messages_for_llm(self, max_messages: int = 20, stable_prefix: int = 0) -> list[dict]:
+        """Get recent messages formatted for LLM context.
+
+        With ``stable_prefix`` set, the first messages of the conversation are
+        always included ahead of the most recent ones. That keeps the start
+        of every request identical across turns so provider-side prompt
+        caches keep hitting.
+        """
+        return [
+            {"role": m.role.value, "content": m.content}
+            for m in _iter_window(self._chat_messages, max_messages, stable_prefix)
+        ]
+
+    def get_formatted_history(
+        self, max_messages: int = 20, stable_prefix: int = 0
+    ) -> FormattedHistory:
+        """Get the same window as get_messages_for_llm() as ChatMessage objects."""
+        messages = _window(self._chat_messages, max_messages, stable_prefix)
+        prefix = min(stable_prefix, len(messages)) if 0 < stable_prefix < max_messages else 0
+        return FormattedHistory(messages, stable_prefix=prefix)
+
+    def trim(self, max_messages: int, stable_prefix: int = 0) -> None:
+        """Drop old messages beyond ``max_messages``, keeping the stable prefix.
+
+        Deletes in place, so the usual one-message overflow doesn't copy the
+        whole history into new lists.
+        """
+        excess = len(self._chat_messages) - max_messages
+        if excess > 0:
+            start = stable_prefix if 0 < stable_prefix < max_messages else 0
+            del self._chat_messages[start : start + excess]
+            del self._timestamps[start : start + excess]
 
     def clear(self) -> None:
         """Clear conversation history."""
-        self.messages = []
+        self._chat_messages = []
+        self._timestamps = []
         self.message_count = 0
-        self.last_updated = datetime.now(timezone.utc)
+        self.last_updated_ns = time.time_ns()
 
 
 class UsersConfig(BaseModel):
-    """Configuration for all users (loaded from users.json)."""
+    """Configuration for all users (loaded from users.json).
+
+    Frozen, and ``users`` must not be modified in place: the lookup table
+    is built once. Reload the config to change users.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     users: dict[str, UserConfig] = Field(default_factory=dict)
     default_system_prompt: str = (
@@ -75,18 +153,35 @@ class UsersConfig(BaseModel):
     )
     default_preferences: UserPreferences = Field(default_factory=UserPreferences)
 
+    # email -> (authorized, system prompt, config), so the per-message
+    # lookups are a single dict probe
+    _fast: dict[str, tuple[bool, str, UserConfig]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the lookup table once the config is validated."""
+        default_prompt = self.default_system_prompt
+        self._fast = {
+            email: (user.enabled, user.system_prompt or default_prompt, user)
+            for email, user in self.users.items()
+        }
+
+    @field_validator("users")
+    @classmethod
+    def normalize_emails(cls, v: dict[str, UserConfig]) -> dict[str, UserConfig]:
+        """Key users by lowercased email; lookups lowercase too."""
+        return {email.lower(): user for email, user in v.items()}
+
     def get_user(self, email: str) -> UserConfig | None:
         """Get configuration for a specific user."""
-        return self.users.get(email)
+        entry = self._fast.get(email.lower())
+        return entry[2] if entry else None
 
     def is_authorized(self, email: str) -> bool:
         """Check if a user is authorized (exists and enabled)."""
-        user = self.users.get(email)
-        return user is not None and user.enabled
+        entry = self._fast.get(email.lower())
+        return entry is not None and entry[0]
 
     def get_system_prompt(self, email: str) -> str:
         """Get the system prompt for a user."""
-        user = self.users.get(email)
-        if user and user.system_prompt:
-            return user.system_prompt
-        return self.default_system_prompt
+        entry = self._fast.get(email.lower())
+        return entry[1] if entry else self.default_system_prompt
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 
 from pydantic import BaseModel, Field
 
@@ -32,7 +33,7 @@ class WebhookData(BaseModel):
     person_email: str = Field(alias="personEmail")
     created: datetime
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
 
 
 class WebhookPayload(BaseModel):
@@ -52,7 +53,7 @@ class WebhookPayload(BaseModel):
     actor_id: str = Field(alias="actorId")
     data: WebhookData
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
 
 
 class WebexMessage(BaseModel):
@@ -68,24 +69,28 @@ class WebexMessage(BaseModel):
     person_email: str = Field(alias="personEmail")
     created: datetime
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
 
-    @property
+    @cached_property
     def content(self) -> str:
-        """Get message content, preferring markdown."""
+        """Get message content, preferring markdown (computed once; the model is frozen)."""
         return self.markdown or self.text or ""
 
     @classmethod
     def from_sdk_message(cls, message: object) -> "WebexMessage":
-        """Create from webexteamssdk Message object."""
-        return cls(
+        """Create from webexteamssdk Message object.
+
+        The SDK already exposes typed values (``created`` is a datetime),
+        so the instance is built without re-running validation.
+        """
+        return cls.model_construct(
             id=message.id,  # type: ignore[attr-defined]
-            roomId=message.roomId,  # type: ignore[attr-defined]
-            roomType=message.roomType,  # type: ignore[attr-defined]
+            room_id=message.roomId,  # type: ignore[attr-defined]
+            room_type=message.roomType,  # type: ignore[attr-defined]
             text=getattr(message, "text", None),
             markdown=getattr(message, "markdown", None),
             html=getattr(message, "html", None),
-            personId=message.personId,  # type: ignore[attr-defined]
-            personEmail=message.personEmail,  # type: ignore[attr-defined]
+            person_id=message.personId,  # type: ignore[attr-defined]
+            person_email=message.personEmail,  # type: ignore[attr-defined]
             created=message.created,  # type: ignore[attr-defined]
         )
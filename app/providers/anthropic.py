@@ -1,26 +1,127 @@
 """Anthropic Claude LLM provider."""
 
-import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
-import anthropic
-from anthropic import AsyncAnthropic
+from anthropic import APIError, AsyncAnthropic, AuthenticationError, RateLimitError
+from anthropic.types import Message as AnthropicMessage
 
 from app.core.exceptions import LLMAuthenticationError, LLMProviderError, LLMRateLimitError
+from app.core.json_utils import JSONDecodeError, json_loads
 from app.core.logging import get_logger
-from app.models.llm import ChatMessage, LLMResponse, MessageRole, StreamChunk, TokenUsage, ToolCall
+from app.models.llm import (
+    ChatMessage,
+    LLMResponse,
+    MessageRole,
+    StreamChunk,
+    TokenUsage,
+    ToolCall,
+    to_anthropic,
+)
 from app.models.tools import Tool
 from app.providers.base import BaseLLMProvider
 
 logger = get_logger("anthropic_provider")
 
+# Clients shared by provider instances with the same API key.
+# Providers are also created per request for user model overrides, and each
+# client has its own connection pool, so sharing avoids new TLS handshakes.
+# The SDK's default request timeout is kept.
+_clients: dict[str | None, AsyncAnthropic] = {}
+
+
+def _get_client(api_key: str | None) -> AsyncAnthropic:
+    """Get the shared client for an API key."""
+    client = _clients.get(api_key)
+    if client is None:
+        client = _clients[api_key] = AsyncAnthropic(api_key=api_key)
+    return client
+
+
+async def close_clients() -> None:
+    """Close the shared clients (call on application shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
+
+
+def _with_cache_breakpoint(message: dict[str, Any]) -> dict[str, Any]:
+    """Copy a converted message with a cache breakpoint on its last block.
+
+    Converted messages are cached and shared, so they are never modified.
+    """
+    content = message["content"]
+    if not content:
+        return message
+    if isinstance(content, str):
+        blocks: list[dict[str, Any]] = [{"type": "text", "text": content}]
+    else:
+        blocks = [*content[:-1], dict(content[-1])]
+    blocks[-1]["cache_control"] = {"type": "ephemeral"}
+    return {**message, "content": blocks}
+
+
+# Stream event handlers. Each takes the event and the per-stream state and
+# returns a chunk to yield, or None.
+
+
+def _on_content_block_start(event: Any, state: dict[str, Any]) -> StreamChunk | None:
+    block = event.content_block
+    if block.type == "tool_use":
+        state["tool_call"] = {"id": block.id, "name": block.name, "arguments": bytearray()}
+    return None
+
+
+def _on_content_block_delta(event: Any, state: dict[str, Any]) -> StreamChunk | None:
+    delta = event.delta
+    # Text deltas are the common case, so try them first
+    try:
+        return StreamChunk(content=delta.text)
+    except AttributeError:
+        pass
+    tool_call = state["tool_call"]
+    if tool_call is not None:
+        partial_json = getattr(delta, "partial_json", None)
+        if partial_json:
+            tool_call["arguments"] += partial_json.encode()
+    return None
+
+
+def _on_content_block_stop(event: Any, state: dict[str, Any]) -> StreamChunk | None:
+    tool_call = state["tool_call"]
+    if tool_call is None:
+        return None
+    state["tool_call"] = None
+    raw_args = tool_call["arguments"]
+    try:
+        args = json_loads(raw_args) if raw_args else {}
+    except JSONDecodeError:
+        args = {}
+    return StreamChunk(
+        tool_calls=[ToolCall(id=tool_call["id"], name=tool_call["name"], arguments=args)]
+    )
+
+
+def _on_message_stop(event: Any, state: dict[str, Any]) -> StreamChunk | None:
+    return StreamChunk(done=True, finish_reason="stop")
+
+
+_STREAM_HANDLERS: dict[str, Callable[[Any, dict[str, Any]], StreamChunk | None]] = {
+    "content_block_start": _on_content_block_start,
+    "content_block_delta": _on_content_block_delta,
+    "content_block_stop": _on_content_block_stop,
+    "message_stop": _on_message_stop,
+}
+
 
 class AnthropicProvider(BaseLLMProvider):
     """Anthropic Claude API provider."""
 
     provider_name = "anthropic"
 
+    __slots__ = ("client",)
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -29,38 +130,60 @@ class AnthropicProvider(BaseLLMProvider):
         **kwargs: Any,
     ) -> None:
         super().__init__(api_key=api_key, model=model, max_tokens=max_tokens, **kwargs)
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = _get_client(api_key)
 
     def _convert_messages(
-        self, messages: list[ChatMessage], system_prompt: str | None = None
+        self,
+        messages: list[ChatMessage],
+        system_prompt: str | None = None,
+        cache_prefix: int = 0,
     ) -> tuple[str | None, list[dict[str, Any]]]:
-        """Convert messages to Anthropic format, extracting system prompt."""
-        anthropic_messages = []
-        system = system_prompt
+        """Convert messages to Anthropic format, extracting system prompt.
+
+        With ``cache_prefix`` set, the last of that many leading messages gets
+        a cache breakpoint so the stable start of the history is cached.
+        """
+        system_role = MessageRole.SYSTEM
+        anthropic_messages = [to_anthropic(m) for m in messages if m.role is not system_role]
+
+        if cache_prefix > 0:
+            boundary = sum(1 for m in messages[:cache_prefix] if m.role is not system_role)
+            if boundary:
+                anthropic_messages[boundary - 1] = _with_cache_breakpoint(
+                    anthropic_messages[boundary - 1]
+                )
 
-        for msg in messages:
-            if msg.role == MessageRole.SYSTEM:
-                # Anthropic handles system prompts separately
-                system = msg.content
-                continue
-            anthropic_messages.append(msg.to_anthropic_format())
+        # Anthropic handles system prompts separately; the last one wins
+        system = system_prompt
+        if len(anthropic_messages) != len(messages):
+            system = next(m.content for m in reversed(messages) if m.role is system_role)
 
         return system, anthropic_messages
 
+    @staticmethod
+    def _system_blocks(system: str) -> list[dict[str, Any]]:
+        """Wrap the system prompt with a prompt-cache breakpoint.
+
+        Tools and the system prompt form the stable start of every request,
+        so marking the system block lets Anthropic reuse that prefix. The
+        stable history prefix gets its own breakpoint in _convert_messages().
+        """
+        return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
     def _convert_tools(self, tools: list[Tool] | None) -> list[dict[str, Any]] | None:
         """Convert tools to Anthropic format."""
         if not tools:
             return None
         return [tool.to_anthropic_format() for tool in tools]
 
-    def _parse_response(self, response: anthropic.types.Message) -> LLMResponse:
+    def _parse_response(self, response: AnthropicMessage) -> LLMResponse:
         """Parse Anthropic response to unified format."""
-        content = ""
+        text_parts: list[str] = []
         tool_calls = []
 
         for block in response.content:
             if block.type == "text":
-                content += block.text
+                text_parts.append(block.text)
             elif block.type == "tool_use":
                 tool_calls.append(
                     ToolCall(
@@ -78,7 +201,7 @@ class AnthropicProvider(BaseLLMProvider):
             finish_reason = "length"
 
         return LLMResponse(
-            content=content,
+            content="".join(text_parts),
             tool_calls=tool_calls if tool_calls else None,
             finish_reason=finish_reason,
             usage=TokenUsage.from_anthropic(response.usage),
@@ -94,7 +217,9 @@ class AnthropicProvider(BaseLLMProvider):
         **kwargs: Any,
     ) -> LLMResponse:
         """Send a chat completion request to Anthropic."""
-        system, anthropic_messages = self._convert_messages(messages, system_prompt)
+        system, anthropic_messages = self._convert_messages(
+            messages, system_prompt, kwargs.get("cache_prefix", 0)
+        )
         anthropic_tools = self._convert_tools(tools)
 
         logger.debug(
@@ -112,7 +237,7 @@ class AnthropicProvider(BaseLLMProvider):
             }
 
             if system:
-                request_kwargs["system"] = system
+                request_kwargs["system"] = self._system_blocks(system)
             if anthropic_tools:
                 request_kwargs["tools"] = anthropic_tools
 
@@ -126,17 +251,17 @@ class AnthropicProvider(BaseLLMProvider):
             )
             return result
 
-        except anthropic.AuthenticationError as e:
+        except AuthenticationError as e:
             logger.error("anthropic_auth_error", error=str(e))
             raise LLMAuthenticationError(
                 "Authentication failed", provider=self.provider_name
             ) from e
-        except anthropic.RateLimitError as e:
+        except RateLimitError as e:
             logger.warning("anthropic_rate_limit", error=str(e))
             raise LLMRateLimitError(
                 "Rate limit exceeded", provider=self.provider_name
             ) from e
-        except anthropic.APIError as e:
+        except APIError as e:
             logger.error("anthropic_api_error", error=str(e), status_code=e.status_code)
             raise LLMProviderError(
                 f"API error: {e.message}",
@@ -152,7 +277,9 @@ class AnthropicProvider(BaseLLMProvider):
         **kwargs: Any,
     ) -> AsyncIterator[StreamChunk]:
         """Stream a chat completion response from Anthropic."""
-        system, anthropic_messages = self._convert_messages(messages, system_prompt)
+        system, anthropic_messages = self._convert_messages(
+            messages, system_prompt, kwargs.get("cache_prefix", 0)
+        )
         anthropic_tools = self._convert_tools(tools)
 
         logger.debug(
@@ -169,69 +296,40 @@ class AnthropicProvider(BaseLLMProvider):
             }
 
             if system:
-                request_kwargs["system"] = system
+                request_kwargs["system"] = self._system_blocks(system)
             if anthropic_tools:
                 request_kwargs["tools"] = anthropic_tools
 
             async with self.client.messages.stream(**request_kwargs) as stream:
-                current_tool_call: dict[str, Any] | None = None
+                state: dict[str, Any] = {"tool_call": None}
+                handlers = _STREAM_HANDLERS
 
                 async for event in stream:
-                    if event.type == "content_block_start":
-                        if hasattr(event.content_block, "type"):
-                            if event.content_block.type == "tool_use":
-                                current_tool_call = {
-                                    "id": event.content_block.id,
-                                    "name": event.content_block.name,
-                                    "arguments": "",
-                                }
-
-                    elif event.type == "content_block_delta":
-                        if hasattr(event.delta, "text"):
-                            yield StreamChunk(content=event.delta.text)
-                        elif hasattr(event.delta, "partial_json"):
-                            if current_tool_call:
-                                current_tool_call["arguments"] += event.delta.partial_json
-
-                    elif event.type == "content_block_stop":
-                        if current_tool_call:
-                            try:
-                                args = json.loads(current_tool_call["arguments"])
-                            except json.JSONDecodeError:
-                                args = {}
-                            yield StreamChunk(
-                                tool_calls=[
-                                    ToolCall(
-                                        id=current_tool_call["id"],
-                                        name=current_tool_call["name"],
-                                        arguments=args,
-                                    )
-                                ]
-                            )
-                            current_tool_call = None
-
-                    elif event.type == "message_stop":
-                        yield StreamChunk(done=True, finish_reason="stop")
-
-        except anthropic.AuthenticationError as e:
+                    handler = handlers.get(event.type)
+                    if handler is not None:
+                        chunk = handler(event, state)
+                        if chunk is not None:
+                            yield chunk
+
+        except AuthenticationError as e:
             logger.error("anthropic_stream_auth_error", error=str(e))
             raise LLMAuthenticationError(
                 "Authentication failed", provider=self.provider_name
             ) from e
-        except anthropic.RateLimitError as e:
+        except RateLimitError as e:
             logger.warning("anthropic_stream_rate_limit", error=str(e))
             raise LLMRateLimitError(
                 "Rate limit exceeded", provider=self.provider_name
             ) from e
-        except anthropic.APIError as e:
+        except APIError as e:
             logger.error("anthropic_stream_error", error=str(e))
             raise LLMProviderError(
                 f"Streaming error: {e.message}",
                 provider=self.provider_name,
             ) from e
 
-    async def health_check(self) -> bool:
-        """Check if Anthropic API is accessible."""
+    async def _probe_health(self) -> bool:
+        """Make a minimal API request to check the provider."""
         try:
             # Make a minimal request to verify API key
             response = await self.client.messages.create(
@@ -1,18 +1,37 @@
 """Abstract base class for LLM providers."""
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from typing import Any
 
+from app.core.exceptions import LLMRateLimitError
 from app.models.llm import ChatMessage, LLMResponse, StreamChunk
 from app.models.tools import Tool
 
+# How long a health check result is reused; failures are retried sooner
+_HEALTH_TTL_NS = 30 * 10**9
+_HEALTH_FAILURE_TTL_NS = 5 * 10**9
+
 
 class BaseLLMProvider(ABC):
     """Abstract base class for all LLM providers."""
 
     provider_name: str = "base"
 
+    # Providers are created per model override; slots keep instances small
+    __slots__ = (
+        "api_key",
+        "model",
+        "max_tokens",
+        "base_url",
+        "timeout",
+        "_health_ok",
+        "_health_checked_ns",
+        "_health_lock",
+    )
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -26,6 +45,9 @@ class BaseLLMProvider(ABC):
         self.max_tokens = max_tokens
         self.base_url = base_url
         self.timeout = timeout
+        self._health_ok = False
+        self._health_checked_ns: int | None = None
+        self._health_lock = asyncio.Lock()
 
     @abstractmethod
     async def chat(
@@ -74,11 +96,68 @@ class BaseLLMProvider(ABC):
         if False:
             yield StreamChunk()
 
-    @abstractmethod
+    async def abatch(
+        self,
+        batch: list[list[ChatMessage]],
+        *,
+        max_concurrency: int = 16,
+        max_retries: int = 2,
+        **kwargs: Any,
+    ) -> list[LLMResponse | BaseException]:
+        """
+        Send several independent chat requests concurrently.
+
+        Args:
+            batch: One message list per request
+            max_concurrency: Maximum requests in flight at once
+            max_retries: Retries per request after a rate limit error
+            **kwargs: Passed through to chat()
+
+        Returns:
+            Results in input order; a failed request gives its exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(messages: list[ChatMessage]) -> LLMResponse:
+            async with semaphore:
+                for attempt in range(max_retries):
+                    try:
+                        return await self.chat(messages, **kwargs)
+                    except LLMRateLimitError as e:
+                        await asyncio.sleep(e.retry_after or 2**attempt)
+                return await self.chat(messages, **kwargs)
+
+        return await asyncio.gather(*(run(m) for m in batch), return_exceptions=True)
+
     async def health_check(self) -> bool:
         """
         Check if the provider is available and configured correctly.
 
+        Probes are often real API requests, so the result is cached for a
+        short time and concurrent callers share a single probe.
+
+        Returns:
+            True if healthy, False otherwise
+        """
+        async with self._health_lock:
+            checked_ns = self._health_checked_ns
+            ttl_ns = _HEALTH_TTL_NS if self._health_ok else _HEALTH_FAILURE_TTL_NS
+            if checked_ns is not None and time.monotonic_ns() - checked_ns < ttl_ns:
+                return self._health_ok
+
+            self._health_ok = await self._probe_health()
+            self._health_checked_ns = time.monotonic_ns()
+            return self._health_ok
+
+    def invalidate_health(self) -> None:
+        """Forget the cached health result so the next check probes again."""
+        self._health_checked_ns = None
+
+    @abstractmethod
+    async def _probe_health(self) -> bool:
+        """
+        Probe the provider without caching.
+
         Returns:
             True if healthy, False otherwise
         """
@@ -1,25 +1,146 @@
 """Google Gemini LLM provider."""
 
-from collections.abc import AsyncIterator
-from typing import Any
+import json
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 from google.generativeai.types import GenerateContentResponse
+from google.protobuf import struct_pb2
 
 from app.core.exceptions import LLMAuthenticationError, LLMProviderError, LLMRateLimitError
 from app.core.logging import get_logger
-from app.models.llm import ChatMessage, LLMResponse, MessageRole, StreamChunk, TokenUsage, ToolCall
+from app.models.llm import (
+    ChatMessage,
+    LLMResponse,
+    MessageRole,
+    StreamChunk,
+    TokenUsage,
+    ToolCall,
+    to_gemini,
+)
 from app.models.tools import Tool
 from app.providers.base import BaseLLMProvider
 
+if TYPE_CHECKING:
+    from google.generativeai.generative_models import GenerativeModel
+    from google.generativeai.types import GenerationConfig
+
 logger = get_logger("gemini_provider")
 
+# Gemini finish reasons that map to something other than "stop"
+_FINISH_REASONS = {
+    genai.protos.Candidate.FinishReason.MAX_TOKENS: "length",
+    genai.protos.Candidate.FinishReason.SAFETY: "error",
+}
+
+# SDK errors by category: typed exceptions first, then message substrings
+# for errors the SDK doesn't type (e.g. an invalid key is a 400)
+_AUTH_ERRORS = (google_exceptions.Unauthenticated, google_exceptions.PermissionDenied)
+_AUTH_MARKERS = ("api key", "authentication")
+_RATE_LIMIT_ERRORS = (google_exceptions.ResourceExhausted, google_exceptions.TooManyRequests)
+_RATE_LIMIT_MARKERS = ("rate", "quota")
+
+# Per-call kwargs passed through to GenerationConfig
+_GENERATION_OVERRIDES = ("temperature", "top_p", "top_k")
+
+# Max GenerativeModel instances kept per provider, one per system prompt
+_MODEL_CACHE_SIZE = 32
+
+# JSON Schema type name -> Gemini proto type
+_TYPE_MAPPING = {
+    "string": genai.protos.Type.STRING,
+    "number": genai.protos.Type.NUMBER,
+    "integer": genai.protos.Type.INTEGER,
+    "boolean": genai.protos.Type.BOOLEAN,
+    "array": genai.protos.Type.ARRAY,
+    "object": genai.protos.Type.OBJECT,
+}
+
+
+def _build_schema(schema: dict[str, Any]) -> genai.protos.Schema:
+    """Build a Gemini Schema proto from JSON Schema."""
+    fields: dict[str, Any] = {
+        "type": _TYPE_MAPPING.get(schema.get("type", "string"), genai.protos.Type.STRING),
+    }
+
+    if "description" in schema:
+        fields["description"] = schema["description"]
+
+    if "properties" in schema:
+        fields["properties"] = {
+            prop_name: _build_schema(prop_schema)
+            for prop_name, prop_schema in schema["properties"].items()
+        }
+
+    if "required" in schema:
+        fields["required"] = schema["required"]
+
+    if "items" in schema:
+        fields["items"] = _build_schema(schema["items"])
+
+    if "enum" in schema:
+        fields["enum"] = schema["enum"]
+
+    return genai.protos.Schema(**fields)
+
+
+@lru_cache(maxsize=256)
+def _schema_bytes(schema_json: str) -> bytes:
+    """Serialized Schema proto for a JSON-encoded schema.
+
+    Protos are mutable, so the cache holds bytes and each caller gets a
+    fresh copy; deserializing is much cheaper than building the tree.
+    """
+    data: bytes = genai.protos.Schema.serialize(_build_schema(json.loads(schema_json)))
+    return data
+
+
+def _value_to_py(value: struct_pb2.Value) -> Any:
+    """Convert a protobuf Value to plain Python, dispatching on its kind."""
+    kind = value.WhichOneof("kind")
+    if kind == "struct_value":
+        return _struct_to_py(value.struct_value)
+    if kind == "list_value":
+        return [_value_to_py(v) for v in value.list_value.values]
+    if kind is None or kind == "null_value":
+        return None
+    return getattr(value, kind)
+
+
+def _struct_to_py(struct: struct_pb2.Struct) -> dict[str, Any]:
+    """Convert a protobuf Struct to a plain dict (nested values included)."""
+    return {key: _value_to_py(value) for key, value in struct.fields.items()}
+
+
+def _parse_parts(parts: Any) -> Iterator[tuple[str | None, Any]]:
+    """Yield (kind, value) for each content part via its ``data`` oneof.
+
+    Works on the raw protobuf parts: one WhichOneof call per part instead
+    of hasattr probes, which are always true on proto-plus messages.
+    """
+    to_pb = genai.protos.Part.pb
+    for part in parts:
+        pb_part = to_pb(part)
+        kind = pb_part.WhichOneof("data")
+        if kind == "text":
+            yield kind, pb_part.text
+        elif kind == "function_call":
+            yield kind, pb_part.function_call
+        else:
+            yield kind, None
+
 
 class GeminiProvider(BaseLLMProvider):
     """Google Gemini API provider."""
 
     provider_name = "gemini"
 
+    __slots__ = ("client", "_model_cache", "_tools_cache", "_default_generation_config")
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -30,27 +151,85 @@ class GeminiProvider(BaseLLMProvider):
         super().__init__(api_key=api_key, model=model, max_tokens=max_tokens, **kwargs)
         genai.configure(api_key=api_key)
         self.client = genai.GenerativeModel(model)
+        # LRU of models by system prompt (the instruction is fixed per model)
+        self._model_cache: OrderedDict[str, GenerativeModel] = OrderedDict()
+        # Last converted tool set; holding the tools keeps their ids valid
+        self._tools_cache: tuple[tuple[Tool, ...], list[Any]] | None = None
+        # Reused by every request that doesn't override sampling settings
+        self._default_generation_config = genai.GenerationConfig(max_output_tokens=max_tokens)
+
+    def _generation_config(self, kwargs: dict[str, Any]) -> "GenerationConfig":
+        """Get the generation config, building one only for per-call overrides."""
+        overrides = {k: kwargs[k] for k in _GENERATION_OVERRIDES if k in kwargs}
+        if not overrides:
+            return self._default_generation_config
+        return genai.GenerationConfig(max_output_tokens=self.max_tokens, **overrides)
+
+    def _get_model(self, system: str | None) -> "GenerativeModel":
+        """Get a model for the system prompt, reusing recent instances."""
+        if not system:
+            return self.client
+
+        cache = self._model_cache
+        model = cache.get(system)
+        if model is None:
+            model = cache[system] = genai.GenerativeModel(
+                self.model,
+                system_instruction=system,
+            )
+            if len(cache) > _MODEL_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(system)
+        return model
+
+    def _convert_error(self, e: Exception, streaming: bool = False) -> LLMProviderError:
+        """Log an SDK error and convert it to the matching LLM error."""
+        event_prefix = "gemini_stream" if streaming else "gemini"
+        error_str = str(e)
+        lowered = error_str.lower()
+
+        if isinstance(e, _AUTH_ERRORS) or any(m in lowered for m in _AUTH_MARKERS):
+            logger.error(f"{event_prefix}_auth_error", error=error_str)
+            return LLMAuthenticationError("Authentication failed", provider=self.provider_name)
+
+        if isinstance(e, _RATE_LIMIT_ERRORS) or any(m in lowered for m in _RATE_LIMIT_MARKERS):
+            logger.warning(f"{event_prefix}_rate_limit", error=error_str)
+            return LLMRateLimitError("Rate limit exceeded", provider=self.provider_name)
+
+        if streaming:
+            logger.error("gemini_stream_error", error=error_str)
+            return LLMProviderError(f"Streaming error: {error_str}", provider=self.provider_name)
+        logger.error("gemini_api_error", error=error_str)
+        return LLMProviderError(f"API error: {error_str}", provider=self.provider_name)
 
     def _convert_messages(
         self, messages: list[ChatMessage], system_prompt: str | None = None
     ) -> tuple[str | None, list[dict[str, Any]]]:
         """Convert messages to Gemini format."""
-        gemini_messages = []
-        system = system_prompt
+        system_role = MessageRole.SYSTEM
+        gemini_messages = [to_gemini(m) for m in messages if m.role is not system_role]
 
-        for msg in messages:
-            if msg.role == MessageRole.SYSTEM:
-                system = msg.content
-                continue
-            gemini_messages.append(msg.to_gemini_format())
+        # System prompts go in the model's system instruction; the last one wins
+        system = system_prompt
+        if len(gemini_messages) != len(messages):
+            system = next(m.content for m in reversed(messages) if m.role is system_role)
 
         return system, gemini_messages
 
     def _convert_tools(self, tools: list[Tool] | None) -> list[Any] | None:
-        """Convert tools to Gemini format."""
+        """Convert tools to Gemini format (reused while the tool set is unchanged)."""
         if not tools:
             return None
 
+        cached = self._tools_cache
+        if cached is not None:
+            cached_tools, converted = cached
+            if len(cached_tools) == len(tools) and all(
+                a is b for a, b in zip(cached_tools, tools, strict=True)
+            ):
+                return converted
+
         function_declarations = []
         for tool in tools:
             function_declarations.append(
@@ -61,60 +240,55 @@ class GeminiProvider(BaseLLMProvider):
                 )
             )
 
-        return [genai.protos.Tool(function_declarations=function_declarations)]
-
-    def _convert_schema_to_gemini(self, schema: dict[str, Any]) -> genai.protos.Schema:
-        """Convert JSON Schema to Gemini Schema proto."""
-        type_mapping = {
-            "string": genai.protos.Type.STRING,
-            "number": genai.protos.Type.NUMBER,
-            "integer": genai.protos.Type.INTEGER,
-            "boolean": genai.protos.Type.BOOLEAN,
-            "array": genai.protos.Type.ARRAY,
-            "object": genai.protos.Type.OBJECT,
-        }
-
-        schema_type = type_mapping.get(schema.get("type", "string"), genai.protos.Type.STRING)
-
-        proto_schema = genai.protos.Schema(type=schema_type)
+        converted = [genai.protos.Tool(function_declarations=function_declarations)]
+        self._tools_cache = (tuple(tools), converted)
+        return converted
 
-        if "description" in schema:
-            proto_schema.description = schema["description"]
-
-        if "properties" in schema:
-            for prop_name, prop_schema in schema["properties"].items():
-                proto_schema.properties[prop_name].CopyFrom(
-                    self._convert_schema_to_gemini(prop_schema)
-                )
-
-        if "required" in schema:
-            proto_schema.required.extend(schema["required"])
+    def _prepare_request(
+        self,
+        messages: list[ChatMessage],
+        system_prompt: str | None,
+        tools: list[Tool] | None,
+    ) -> tuple[str | None, list[dict[str, Any]], list[Any] | None]:
+        """Convert messages and tools for a request (shared by chat and stream)."""
+        system, gemini_messages = self._convert_messages(messages, system_prompt)
+        return system, gemini_messages, self._convert_tools(tools)
 
-        if "items" in schema:
-            proto_schema.items.CopyFrom(self._convert_schema_to_gemini(schema["items"]))
+    def _start_chat(
+        self, system: str | None, gemini_messages: list[dict[str, Any]]
+    ) -> tuple[Any, str]:
+        """Start a chat over all but the last message; return it and the last text."""
+        model = self._get_model(system)
+        chat = model.start_chat(history=gemini_messages[:-1] if len(gemini_messages) > 1 else [])
 
-        if "enum" in schema:
-            proto_schema.enum.extend(schema["enum"])
+        last_message = gemini_messages[-1] if gemini_messages else {"parts": [{"text": ""}]}
+        last_content = last_message.get("parts", [{}])[0].get("text", "")
+        return chat, last_content
 
-        return proto_schema
+    def _convert_schema_to_gemini(self, schema: dict[str, Any]) -> genai.protos.Schema:
+        """Convert JSON Schema to Gemini Schema proto."""
+        schema_proto: genai.protos.Schema = genai.protos.Schema.deserialize(
+            _schema_bytes(json.dumps(schema, sort_keys=True))
+        )
+        return schema_proto
 
     def _parse_response(self, response: GenerateContentResponse) -> LLMResponse:
         """Parse Gemini response to unified format."""
-        content = ""
+        text_parts: list[str] = []
         tool_calls = []
 
         if response.candidates:
             candidate = response.candidates[0]
-            for part in candidate.content.parts:
-                if hasattr(part, "text") and part.text:
-                    content += part.text
-                elif hasattr(part, "function_call"):
-                    fc = part.function_call
+            for kind, value in _parse_parts(candidate.content.parts):
+                if kind == "text":
+                    if value:
+                        text_parts.append(value)
+                elif kind == "function_call":
                     tool_calls.append(
                         ToolCall(
-                            id=f"call_{fc.name}_{len(tool_calls)}",
-                            name=fc.name,
-                            arguments=dict(fc.args) if fc.args else {},
+                            id=f"call_{value.name}_{len(tool_calls)}",
+                            name=value.name,
+                            arguments=_struct_to_py(value.args),
                         )
                     )
 
@@ -122,12 +296,8 @@ class GeminiProvider(BaseLLMProvider):
         finish_reason = "stop"
         if tool_calls:
             finish_reason = "tool_calls"
-        elif response.candidates and response.candidates[0].finish_reason:
-            reason = response.candidates[0].finish_reason.name
-            if reason == "MAX_TOKENS":
-                finish_reason = "length"
-            elif reason == "SAFETY":
-                finish_reason = "error"
+        elif response.candidates:
+            finish_reason = _FINISH_REASONS.get(response.candidates[0].finish_reason, "stop")
 
         # Get usage if available
         usage = None
@@ -139,7 +309,7 @@ class GeminiProvider(BaseLLMProvider):
             )
 
         return LLMResponse(
-            content=content,
+            content="".join(text_parts),
             tool_calls=tool_calls if tool_calls else None,
             finish_reason=finish_reason,
             usage=usage,
@@ -155,8 +325,9 @@ class GeminiProvider(BaseLLMProvider):
         **kwargs: Any,
     ) -> LLMResponse:
         """Send a chat completion request to Gemini."""
-        system, gemini_messages = self._convert_messages(messages, system_prompt)
-        gemini_tools = self._convert_tools(tools)
+        system, gemini_messages, gemini_tools = self._prepare_request(
+            messages, system_prompt, tools
+        )
 
         logger.debug(
             "gemini_request",
@@ -166,23 +337,10 @@ class GeminiProvider(BaseLLMProvider):
         )
 
         try:
-            # Create a new model instance with system instruction if provided
-            model = self.client
-            if system:
-                model = genai.GenerativeModel(
-                    self.model,
-                    system_instruction=system,
-                )
-
-            generation_config = genai.GenerationConfig(
-                max_output_tokens=self.max_tokens,
-            )
-
-            # Start chat and send messages
-            chat = model.start_chat(history=gemini_messages[:-1] if len(gemini_messages) > 1 else [])
+            generation_config = self._generation_config(kwargs)
 
-            last_message = gemini_messages[-1] if gemini_messages else {"parts": [{"text": ""}]}
-            last_content = last_message.get("parts", [{}])[0].get("text", "")
+            # Start chat (with the system instruction's model) and send messages
+            chat, last_content = self._start_chat(system, gemini_messages)
 
             response = await chat.send_message_async(
                 last_content,
@@ -199,23 +357,7 @@ class GeminiProvider(BaseLLMProvider):
             return result
 
         except Exception as e:
-            error_str = str(e).lower()
-            if "api key" in error_str or "authentication" in error_str:
-                logger.error("gemini_auth_error", error=str(e))
-                raise LLMAuthenticationError(
-                    "Authentication failed", provider=self.provider_name
-                ) from e
-            elif "rate" in error_str or "quota" in error_str:
-                logger.warning("gemini_rate_limit", error=str(e))
-                raise LLMRateLimitError(
-                    "Rate limit exceeded", provider=self.provider_name
-                ) from e
-            else:
-                logger.error("gemini_api_error", error=str(e))
-                raise LLMProviderError(
-                    f"API error: {str(e)}",
-                    provider=self.provider_name,
-                ) from e
+            raise self._convert_error(e) from e
 
     async def stream(
         self,
@@ -225,8 +367,9 @@ class GeminiProvider(BaseLLMProvider):
         **kwargs: Any,
     ) -> AsyncIterator[StreamChunk]:
         """Stream a chat completion response from Gemini."""
-        system, gemini_messages = self._convert_messages(messages, system_prompt)
-        gemini_tools = self._convert_tools(tools)
+        system, gemini_messages, gemini_tools = self._prepare_request(
+            messages, system_prompt, tools
+        )
 
         logger.debug(
             "gemini_stream_start",
@@ -235,21 +378,9 @@ class GeminiProvider(BaseLLMProvider):
         )
 
         try:
-            model = self.client
-            if system:
-                model = genai.GenerativeModel(
-                    self.model,
-                    system_instruction=system,
-                )
+            generation_config = self._generation_config(kwargs)
 
-            generation_config = genai.GenerationConfig(
-                max_output_tokens=self.max_tokens,
-            )
-
-            chat = model.start_chat(history=gemini_messages[:-1] if len(gemini_messages) > 1 else [])
-
-            last_message = gemini_messages[-1] if gemini_messages else {"parts": [{"text": ""}]}
-            last_content = last_message.get("parts", [{}])[0].get("text", "")
+            chat, last_content = self._start_chat(system, gemini_messages)
 
             response = await chat.send_message_async(
                 last_content,
@@ -258,46 +389,53 @@ class GeminiProvider(BaseLLMProvider):
                 stream=True,
             )
 
+            # Optionally coalesce text: emit every N parts or at a newline
+            coalesce = max(1, int(kwargs.get("stream_coalesce", 1)))
+            text_buffer: list[str] = []
+            # Chunks can repeat an identical function call; emit it once
+            last_call: bytes | None = None
+            parse_parts = _parse_parts
+            buffer_text = text_buffer.append
+
             async for chunk in response:
-                if chunk.candidates:
-                    for part in chunk.candidates[0].content.parts:
-                        if hasattr(part, "text") and part.text:
-                            yield StreamChunk(content=part.text)
-                        elif hasattr(part, "function_call"):
-                            fc = part.function_call
-                            yield StreamChunk(
-                                tool_calls=[
-                                    ToolCall(
-                                        id=f"call_{fc.name}",
-                                        name=fc.name,
-                                        arguments=dict(fc.args) if fc.args else {},
-                                    )
-                                ]
-                            )
+                # Each proto-plus attribute access wraps a message; read once
+                candidates = chunk.candidates
+                if not candidates:
+                    continue
+                for kind, value in parse_parts(candidates[0].content.parts):
+                    if kind == "text":
+                        if value:
+                            buffer_text(value)
+                            if len(text_buffer) >= coalesce or "\n" in value:
+                                yield StreamChunk(content="".join(text_buffer))
+                                text_buffer.clear()
+                    elif kind == "function_call":
+                        call_key = value.SerializeToString(deterministic=True)
+                        if call_key == last_call:
+                            continue
+                        last_call = call_key
+                        if text_buffer:
+                            yield StreamChunk(content="".join(text_buffer))
+                            text_buffer.clear()
+                        yield StreamChunk(
+                            tool_calls=[
+                                ToolCall(
+                                    id=f"call_{value.name}",
+                                    name=value.name,
+                                    arguments=_struct_to_py(value.args),
+                                )
+                            ]
+                        )
 
+            if text_buffer:
+                yield StreamChunk(content="".join(text_buffer))
             yield StreamChunk(done=True, finish_reason="stop")
 
         except Exception as e:
-            error_str = str(e).lower()
-            if "api key" in error_str or "authentication" in error_str:
-                logger.error("gemini_stream_auth_error", error=str(e))
-                raise LLMAuthenticationError(
-                    "Authentication failed", provider=self.provider_name
-                ) from e
-            elif "rate" in error_str or "quota" in error_str:
-                logger.warning("gemini_stream_rate_limit", error=str(e))
-                raise LLMRateLimitError(
-                    "Rate limit exceeded", provider=self.provider_name
-                ) from e
-            else:
-                logger.error("gemini_stream_error", error=str(e))
-                raise LLMProviderError(
-                    f"Streaming error: {str(e)}",
-                    provider=self.provider_name,
-                ) from e
-
-    async def health_check(self) -> bool:
-        """Check if Gemini API is accessible."""
+            raise self._convert_error(e, streaming=True) from e
+
+    async def _probe_health(self) -> bool:
+        """Make a minimal generate request to check the provider."""
         try:
             response = await self.client.generate_content_async("Hi")
             return response is not None
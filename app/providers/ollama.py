@@ -1,26 +1,50 @@
 """Ollama local LLM provider."""
 
-import json
 from collections.abc import AsyncIterator
 from typing import Any
 
+import httpx
 import ollama
 from ollama import AsyncClient
 
 from app.core.exceptions import LLMProviderError
+from app.core.json_utils import JSONDecodeError, json_loads
 from app.core.logging import get_logger
-from app.models.llm import ChatMessage, LLMResponse, StreamChunk, TokenUsage, ToolCall
+from app.models.llm import ChatMessage, LLMResponse, StreamChunk, TokenUsage, ToolCall, to_openai
 from app.models.tools import Tool
 from app.providers.base import BaseLLMProvider
 
 logger = get_logger("ollama_provider")
 
 
+def _parse_tool_call(tc: Any) -> ToolCall | None:
+    """Convert an Ollama tool call to a ToolCall, parsing string arguments.
+
+    Returns None (and logs) for a tool call without a function name.
+    """
+    try:
+        func = tc["function"]
+        name = func["name"]
+    except (KeyError, TypeError):
+        logger.warning("ollama_tool_call_malformed", tool_call=str(tc))
+        return None
+
+    args = func.get("arguments") or {}
+    if isinstance(args, str):
+        try:
+            args = json_loads(args)
+        except JSONDecodeError:
+            args = {}
+    return ToolCall(id=tc.get("id") or f"call_{name}", name=name, arguments=args)
+
+
 class OllamaProvider(BaseLLMProvider):
     """Ollama local LLM provider."""
 
     provider_name = "ollama"
 
+    __slots__ = ("client", "_connect_error", "_timeout_error")
+
     def __init__(
         self,
         base_url: str = "http://localhost:11434",
@@ -29,20 +53,18 @@ class OllamaProvider(BaseLLMProvider):
         **kwargs: Any,
     ) -> None:
         super().__init__(base_url=base_url, model=model, timeout=timeout, **kwargs)
-        self.client = AsyncClient(host=base_url)
+        self.client = AsyncClient(host=base_url, timeout=timeout)
+        # Messages for the common transport failures, built once
+        self._connect_error = f"Cannot connect to Ollama at {base_url}"
+        self._timeout_error = f"Ollama request timed out after {timeout}s"
 
     def _convert_messages(
         self, messages: list[ChatMessage], system_prompt: str | None = None
     ) -> list[dict[str, Any]]:
         """Convert messages to Ollama format (OpenAI-compatible)."""
-        ollama_messages = []
-
+        ollama_messages = [to_openai(m) for m in messages]
         if system_prompt:
-            ollama_messages.append({"role": "system", "content": system_prompt})
-
-        for msg in messages:
-            ollama_messages.append(msg.to_ollama_format())
-
+            return [{"role": "system", "content": system_prompt}, *ollama_messages]
         return ollama_messages
 
     def _convert_tools(self, tools: list[Tool] | None) -> list[dict[str, Any]] | None:
@@ -57,22 +79,10 @@ class OllamaProvider(BaseLLMProvider):
         content = message.get("content", "")
         tool_calls = []
 
-        if message.get("tool_calls"):
-            for tc in message["tool_calls"]:
-                func = tc.get("function", {})
-                args = func.get("arguments", {})
-                if isinstance(args, str):
-                    try:
-                        args = json.loads(args)
-                    except json.JSONDecodeError:
-                        args = {}
-                tool_calls.append(
-                    ToolCall(
-                        id=tc.get("id", f"call_{func.get('name', 'unknown')}"),
-                        name=func.get("name", ""),
-                        arguments=args,
-                    )
-                )
+        for tc in message.get("tool_calls") or ():
+            tool_call = _parse_tool_call(tc)
+            if tool_call is not None:
+                tool_calls.append(tool_call)
 
         # Determine finish reason
         finish_reason = "stop"
@@ -144,6 +154,13 @@ class OllamaProvider(BaseLLMProvider):
                 provider=self.provider_name,
                 status_code=e.status_code,
             ) from e
+        except httpx.TimeoutException as e:
+            logger.error("ollama_timeout", timeout=self.timeout)
+            raise LLMProviderError(self._timeout_error, provider=self.provider_name) from e
+        except (ConnectionError, httpx.ConnectError) as e:
+            # The SDK re-raises httpx.ConnectError as the builtin ConnectionError
+            logger.error("ollama_connect_error", base_url=self.base_url)
+            raise LLMProviderError(self._connect_error, provider=self.provider_name) from e
         except Exception as e:
             logger.error("ollama_error", error=str(e))
             raise LLMProviderError(
@@ -180,41 +197,36 @@ class OllamaProvider(BaseLLMProvider):
 
             stream = await self.client.chat(**request_kwargs)
 
-            accumulated_tool_calls: list[dict[str, Any]] = []
+            # Parsed as they arrive so the done chunk only has to emit them
+            accumulated_tool_calls: list[ToolCall] = []
 
             async for chunk in stream:
-                message = chunk.get("message", {})
+                # Nearly every chunk carries content, so index directly and
+                # only fall back to .get() when something is missing
+                try:
+                    message = chunk["message"]
+                    content = message["content"]
+                except KeyError:
+                    message = chunk.get("message") or {}
+                    content = None
 
                 # Handle text content
-                if message.get("content"):
-                    yield StreamChunk(content=message["content"])
+                if content:
+                    yield StreamChunk(content=content)
 
                 # Handle tool calls
-                if message.get("tool_calls"):
-                    for tc in message["tool_calls"]:
-                        accumulated_tool_calls.append(tc)
+                tool_calls = message.get("tool_calls")
+                if tool_calls:
+                    for tc in tool_calls:
+                        tool_call = _parse_tool_call(tc)
+                        if tool_call is not None:
+                            accumulated_tool_calls.append(tool_call)
 
                 # Check for completion
                 if chunk.get("done"):
                     # Emit accumulated tool calls
                     if accumulated_tool_calls:
-                        tool_calls = []
-                        for tc in accumulated_tool_calls:
-                            func = tc.get("function", {})
-                            args = func.get("arguments", {})
-                            if isinstance(args, str):
-                                try:
-                                    args = json.loads(args)
-                                except json.JSONDecodeError:
-                                    args = {}
-                            tool_calls.append(
-                                ToolCall(
-                                    id=tc.get("id", f"call_{func.get('name', 'unknown')}"),
-                                    name=func.get("name", ""),
-                                    arguments=args,
-                                )
-                            )
-                        yield StreamChunk(tool_calls=tool_calls)
+                        yield StreamChunk(tool_calls=accumulated_tool_calls)
 
                     finish_reason = "stop"
                     if accumulated_tool_calls:
@@ -231,6 +243,13 @@ class OllamaProvider(BaseLLMProvider):
                 provider=self.provider_name,
                 status_code=e.status_code,
             ) from e
+        except httpx.TimeoutException as e:
+            logger.error("ollama_stream_timeout", timeout=self.timeout)
+            raise LLMProviderError(self._timeout_error, provider=self.provider_name) from e
+        except (ConnectionError, httpx.ConnectError) as e:
+            # The SDK re-raises httpx.ConnectError as the builtin ConnectionError
+            logger.error("ollama_stream_connect_error", base_url=self.base_url)
+            raise LLMProviderError(self._connect_error, provider=self.provider_name) from e
         except Exception as e:
             logger.error("ollama_stream_error", error=str(e))
             raise LLMProviderError(
@@ -238,21 +257,25 @@ class OllamaProvider(BaseLLMProvider):
                 provider=self.provider_name,
             ) from e
 
-    async def health_check(self) -> bool:
-        """Check if Ollama is running and the model is available."""
+    async def _probe_health(self) -> bool:
+        """List the installed models and look for ours."""
         try:
             # Check if Ollama is running
             models = await self.client.list()
 
-            # Check if our model is available
-            model_names = [m.get("name", "") for m in models.get("models", [])]
-            model_available = any(self.model in name for name in model_names)
+            # Check if our model is available: exact name first, then a
+            # substring match (e.g. "llama3.1" against "llama3.1:latest").
+            # ollama>=0.4 reports the name as "model"; older servers as "name".
+            model_names = {m.get("model") or m.get("name", "") for m in models.get("models", [])}
+            model_available = self.model in model_names or any(
+                self.model in name for name in model_names
+            )
 
             if not model_available:
                 logger.warning(
                     "ollama_model_not_found",
                     model=self.model,
-                    available_models=model_names,
+                    available_models=sorted(model_names),
                 )
                 return False
 
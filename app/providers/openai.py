@@ -1,6 +1,5 @@
 """OpenAI GPT LLM provider."""
 
-import json
 from collections.abc import AsyncIterator
 from typing import Any
 
@@ -8,19 +7,44 @@ import openai
 from openai import AsyncOpenAI
 
 from app.core.exceptions import LLMAuthenticationError, LLMProviderError, LLMRateLimitError
+from app.core.json_utils import JSONDecodeError, json_loads
 from app.core.logging import get_logger
-from app.models.llm import ChatMessage, LLMResponse, StreamChunk, TokenUsage, ToolCall
+from app.models.llm import ChatMessage, LLMResponse, StreamChunk, TokenUsage, ToolCall, to_openai
 from app.models.tools import Tool
 from app.providers.base import BaseLLMProvider
 
 logger = get_logger("openai_provider")
 
+# Clients shared by provider instances with the same API key.
+# Providers are also created per request for user model overrides, and each
+# client has its own connection pool, so sharing avoids new TLS handshakes.
+# The SDK's default request timeout is kept.
+_clients: dict[str | None, AsyncOpenAI] = {}
+
+
+def _get_client(api_key: str | None) -> AsyncOpenAI:
+    """Get the shared client for an API key."""
+    client = _clients.get(api_key)
+    if client is None:
+        client = _clients[api_key] = AsyncOpenAI(api_key=api_key)
+    return client
+
+
+async def close_clients() -> None:
+    """Close the shared clients (call on application shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
+
 
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI API provider."""
 
     provider_name = "openai"
 
+    __slots__ = ("client",)
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -29,21 +53,15 @@ class OpenAIProvider(BaseLLMProvider):
         **kwargs: Any,
     ) -> None:
         super().__init__(api_key=api_key, model=model, max_tokens=max_tokens, **kwargs)
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = _get_client(api_key)
 
     def _convert_messages(
         self, messages: list[ChatMessage], system_prompt: str | None = None
     ) -> list[dict[str, Any]]:
         """Convert messages to OpenAI format."""
-        openai_messages = []
-
-        # Add system prompt first if provided
+        openai_messages = [to_openai(m) for m in messages]
         if system_prompt:
-            openai_messages.append({"role": "system", "content": system_prompt})
-
-        for msg in messages:
-            openai_messages.append(msg.to_openai_format())
-
+            return [{"role": "system", "content": system_prompt}, *openai_messages]
         return openai_messages
 
     def _convert_tools(self, tools: list[Tool] | None) -> list[dict[str, Any]] | None:
@@ -63,8 +81,8 @@ class OpenAIProvider(BaseLLMProvider):
         if message.tool_calls:
             for tc in message.tool_calls:
                 try:
-                    args = json.loads(tc.function.arguments)
-                except json.JSONDecodeError:
+                    args = json_loads(tc.function.arguments)
+                except JSONDecodeError:
                     args = {}
                 tool_calls.append(
                     ToolCall(
@@ -197,10 +215,10 @@ class OpenAIProvider(BaseLLMProvider):
                             current_tool_calls[idx] = {
                                 "id": tc.id or "",
                                 "name": tc.function.name if tc.function else "",
-                                "arguments": "",
+                                "arguments": bytearray(),
                             }
                         if tc.function and tc.function.arguments:
-                            current_tool_calls[idx]["arguments"] += tc.function.arguments
+                            current_tool_calls[idx]["arguments"] += tc.function.arguments.encode()
 
                 # Check for finish
                 finish_reason = chunk.choices[0].finish_reason
@@ -209,9 +227,10 @@ class OpenAIProvider(BaseLLMProvider):
                     if current_tool_calls:
                         tool_calls = []
                         for tc_data in current_tool_calls.values():
+                            raw_args = tc_data["arguments"]
                             try:
-                                args = json.loads(tc_data["arguments"])
-                            except json.JSONDecodeError:
+                                args = json_loads(raw_args) if raw_args else {}
+                            except JSONDecodeError:
                                 args = {}
                             tool_calls.append(
                                 ToolCall(
@@ -244,8 +263,8 @@ class OpenAIProvider(BaseLLMProvider):
                 provider=self.provider_name,
             ) from e
 
-    async def health_check(self) -> bool:
-        """Check if OpenAI API is accessible."""
+    async def _probe_health(self) -> bool:
+        """Make a minimal API request to check the provider."""
         try:
             response = await self.client.chat.completions.create(
                 model=self.model or "gpt-4o",
@@ -1,8 +1,16 @@
 """Provider registry and factory for LLM providers."""
 
+import asyncio
+from functools import lru_cache
 from typing import Any
 
-from app.config import LLMProvider, ProviderConfig, get_settings
+from app.config import (
+    LLMProvider,
+    ProviderConfig,
+    ProviderKwargs,
+    coerce_provider,
+    get_settings,
+)
 from app.core.exceptions import ConfigurationError, LLMProviderError
 from app.core.logging import get_logger
 from app.providers.anthropic import AnthropicProvider
@@ -14,6 +22,15 @@ from app.providers.openai import OpenAIProvider
 logger = get_logger("provider_registry")
 
 
+@lru_cache(maxsize=32)
+def _config_kwargs(config: ProviderConfig) -> ProviderKwargs:
+    """Constructor kwargs for a config (configs are frozen, so cacheable).
+
+    Callers must copy the result before modifying it.
+    """
+    return config.to_kwargs()
+
+
 class ProviderRegistry:
     """Registry and factory for LLM providers."""
 
@@ -50,8 +67,7 @@ class ProviderRegistry:
         Returns:
             Configured provider instance
         """
-        if isinstance(provider, str):
-            provider = LLMProvider(provider)
+        provider = coerce_provider(provider)
 
         settings = get_settings()
 
@@ -59,22 +75,8 @@ class ProviderRegistry:
         if config is None:
             config = settings.get_provider_config(provider)
 
-        # Build constructor kwargs
-        provider_kwargs: dict[str, Any] = {}
-
-        if config.api_key:
-            provider_kwargs["api_key"] = config.api_key
-        if config.model:
-            provider_kwargs["model"] = config.model
-        if config.max_tokens:
-            provider_kwargs["max_tokens"] = config.max_tokens
-        if config.base_url:
-            provider_kwargs["base_url"] = config.base_url
-        if config.timeout:
-            provider_kwargs["timeout"] = config.timeout
-
-        # Apply overrides
-        provider_kwargs.update(kwargs)
+        # Build constructor kwargs, applying overrides
+        provider_kwargs: dict[str, Any] = {**_config_kwargs(config), **kwargs}
 
         # Create instance
         provider_class = cls.get_provider_class(provider)
@@ -97,29 +99,53 @@ class ProviderRegistry:
     ) -> BaseLLMProvider:
         """Get a cached provider instance or create a new one.
 
+        Instances are cached per provider and set of overrides, so callers
+        with different overrides (e.g. a user's model) get separate instances.
+        Overrides that are None are ignored. Creation never awaits, so
+        concurrent requests can't build duplicate instances.
+
         Args:
             provider: Provider name or enum
-            cache_key: Optional key for caching (default: provider name)
+            cache_key: Optional key for caching (default: provider name and overrides)
             **kwargs: Override configuration values
 
         Returns:
             Provider instance (may be cached)
         """
-        if isinstance(provider, str):
-            provider = LLMProvider(provider)
+        provider = coerce_provider(provider)
+        overrides = {k: v for k, v in kwargs.items() if v is not None}
 
         key = cache_key or provider.value
+        if overrides:
+            key = f"{key}:{sorted(overrides.items())!r}"
 
-        if key not in cls._instances:
-            cls._instances[key] = cls.create_provider(provider, **kwargs)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances[key] = cls.create_provider(provider, **overrides)
 
-        return cls._instances[key]
+        return instance
 
     @classmethod
     def clear_cache(cls) -> None:
         """Clear all cached provider instances."""
         cls._instances.clear()
 
+    @classmethod
+    async def _check_provider(cls, provider: LLMProvider) -> BaseLLMProvider | None:
+        """Return the provider instance if it is healthy, else None."""
+        try:
+            instance = cls.get_or_create_provider(provider)
+            if await instance.health_check():
+                return instance
+            logger.warning("provider_unhealthy", provider=provider.value)
+        except Exception as e:
+            logger.warning(
+                "provider_health_check_failed",
+                provider=provider.value,
+                error=str(e),
+            )
+        return None
+
     @classmethod
     async def get_healthy_provider(
         cls,
@@ -159,21 +185,19 @@ class ProviderRegistry:
             if p in available and p not in providers_to_try:
                 providers_to_try.append(p)
 
-        # Try each provider
-        for provider in providers_to_try:
-            try:
-                instance = cls.get_or_create_provider(provider)
-                if await instance.health_check():
+        # The first choice is usually answered from its cached health result.
+        # Fallbacks are only probed once it fails, and then concurrently; each
+        # check runs to completion so its result is cached for later calls.
+        if providers_to_try:
+            first, *fallbacks = providers_to_try
+            results = [await cls._check_provider(first)]
+            if results[0] is None and fallbacks:
+                results += await asyncio.gather(*map(cls._check_provider, fallbacks))
+
+            for provider, instance in zip(providers_to_try, results, strict=True):
+                if instance is not None:
                     logger.info("healthy_provider_found", provider=provider.value)
                     return instance
-                else:
-                    logger.warning("provider_unhealthy", provider=provider.value)
-            except Exception as e:
-                logger.warning(
-                    "provider_health_check_failed",
-                    provider=provider.value,
-                    error=str(e),
-                )
 
         raise LLMProviderError(
             "No healthy LLM provider available",
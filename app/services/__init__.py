@@ -5,6 +5,7 @@ from app.services.llm_service import LLMService
 from app.services.mcp_service import MCPService
 from app.services.user_service import UserService
 from app.services.history_service import HistoryService
+from app.services.response_cache import ResponseCache
 
 __all__ = [
     "WebexService",
@@ -12,4 +13,5 @@ __all__ = [
     "MCPService",
     "UserService",
     "HistoryService",
+    "ResponseCache",
 ]
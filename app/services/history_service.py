@@ -1,9 +1,11 @@
 """Conversation history management service."""
 
-from datetime import datetime, timezone
+import time
 from typing import Any
 
+from app.config import get_settings
 from app.core.logging import get_logger, LogEvents
+from app.models.llm import FormattedHistory
 from app.models.user import ConversationContext
 
 logger = get_logger("history_service")
@@ -17,16 +19,29 @@ class HistoryService:
     """
 
     def __init__(self, max_history_per_room: int = 50) -> None:
+        # Kept in last-updated order (oldest first): rooms are moved to the
+        # end whenever they change, so recency queries stop early
         self._history: dict[str, ConversationContext] = {}
         self._max_history = max_history_per_room
+        # Running total of message_count across all rooms
+        self._total_messages = 0
+        settings = get_settings()
+        self._stable_prefix = settings.history_stable_prefix
+        self._max_rooms = settings.history_max_rooms
 
     def get_or_create_context(
         self,
         room_id: str,
         user_email: str,
     ) -> ConversationContext:
-        """Get existing context or create a new one."""
+        """Get existing context or create a new one.
+
+        At the room limit (if any), the least recently active conversation
+        is dropped to make space.
+        """
         if room_id not in self._history:
+            if 0 < self._max_rooms <= len(self._history):
+                self._evict_oldest()
             self._history[room_id] = ConversationContext(
                 room_id=room_id,
                 user_email=user_email,
@@ -59,10 +74,11 @@ class HistoryService:
         """Add a message to the conversation history."""
         context = self.get_or_create_context(room_id, user_email)
         context.add_message(role, content)
+        self._total_messages += 1
+        self._touch(room_id)
 
-        # Trim history if too long
-        if len(context.messages) > self._max_history:
-            context.messages = context.messages[-self._max_history:]
+        # Trim history if too long, keeping the stable prefix (if any)
+        context.trim(self._max_history, self._stable_prefix)
 
         logger.debug(
             LogEvents.HISTORY_UPDATED,
@@ -82,63 +98,102 @@ class HistoryService:
         context = self._history.get(room_id)
         if not context:
             return []
-        return context.get_messages_for_llm(max_messages)
+        return context.get_messages_for_llm(max_messages, self._stable_prefix)
+
+    def get_formatted_history(
+        self,
+        room_id: str,
+        max_messages: int = 20,
+        include_current: bool = False,
+    ) -> FormattedHistory:
+        """Get conversation messages as ChatMessage objects for the LLM.
+
+        With ``include_current``, the last message is the turn being answered
+        (already added): the window covers ``max_messages`` earlier messages
+        plus that turn, so it still starts on a user message.
+        """
+        context = self._history.get(room_id)
+        if not context:
+            return FormattedHistory([])
+        if include_current:
+            max_messages += 1
+        return context.get_formatted_history(max_messages, self._stable_prefix)
 
     def clear_history(self, room_id: str) -> bool:
         """Clear conversation history for a room."""
-        if room_id in self._history:
-            self._history[room_id].clear()
+        context = self._history.get(room_id)
+        if context is not None:
+            self._total_messages -= context.message_count
+            context.clear()
+            self._touch(room_id)
             logger.info(LogEvents.HISTORY_CLEARED, room_id=room_id)
             return True
         return False
 
     def delete_context(self, room_id: str) -> bool:
         """Completely delete conversation context for a room."""
-        if room_id in self._history:
-            del self._history[room_id]
+        context = self._history.pop(room_id, None)
+        if context is not None:
+            self._total_messages -= context.message_count
             logger.info("conversation_context_deleted", room_id=room_id)
             return True
         return False
 
-    def set_provider(self, room_id: str, provider: str) -> None:
-        """Set the provider being used for a conversation."""
-        context = self._history.get(room_id)
-        if context:
-            context.provider_used = provider
-            logger.debug(
-                "conversation_provider_set",
-                room_id=room_id,
-                provider=provider,
-            )
+    def set_provider(self, context: ConversationContext, provider: str) -> None:
+        """Set the provider being used for a conversation.
 
-    def get_stats(self) -> dict[str, Any]:
-        """Get statistics about conversation history."""
-        total_rooms = len(self._history)
-        total_messages = sum(c.message_count for c in self._history.values())
-        active_rooms = sum(
-            1
-            for c in self._history.values()
-            if (datetime.now(timezone.utc) - c.last_updated).seconds < 3600
+        Takes the context directly so callers that already looked it up
+        don't pay for a second lookup.
+        """
+        context.provider_used = provider
+        logger.debug(
+            "conversation_provider_set",
+            room_id=context.room_id,
+            provider=provider,
         )
 
+    def _evict_oldest(self) -> None:
+        """Drop the least recently active conversation."""
+        room_id = next(iter(self._history))
+        self._total_messages -= self._history.pop(room_id).message_count
+        logger.info("conversation_context_evicted", room_id=room_id)
+
+    def _touch(self, room_id: str) -> None:
+        """Move a just-updated room to the end of the last-updated order."""
+        self._history[room_id] = self._history.pop(room_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get statistics about conversation history.
+
+        Only the recently active rooms are visited, newest first.
+        """
+        active_since_ns = time.time_ns() - 3600 * 1_000_000_000
+        active_rooms = 0
+        for context in reversed(self._history.values()):
+            if context.last_updated_ns <= active_since_ns:
+                break
+            active_rooms += 1
+
         return {
-            "total_rooms": total_rooms,
-            "total_messages": total_messages,
+            "total_rooms": len(self._history),
+            "total_messages": self._total_messages,
             "active_rooms_last_hour": active_rooms,
         }
 
     def cleanup_old_contexts(self, max_age_hours: int = 24) -> int:
-        """Remove conversation contexts older than max_age_hours."""
-        now = datetime.now(timezone.utc)
-        to_remove = []
+        """Remove conversation contexts older than max_age_hours.
 
+        Only the expired rooms are visited, oldest first.
+        """
+        cutoff_ns = time.time_ns() - int(max_age_hours * 3600 * 1_000_000_000)
+        to_remove: list[str] = []
         for room_id, context in self._history.items():
-            age_hours = (now - context.last_updated).total_seconds() / 3600
-            if age_hours > max_age_hours:
-                to_remove.append(room_id)
+            if context.last_updated_ns >= cutoff_ns:
+                break
+            to_remove.append(room_id)
 
         for room_id in to_remove:
-            del self._history[room_id]
+            self._total_messages -= self._history.pop(room_id).message_count
 
         if to_remove:
             logger.info(
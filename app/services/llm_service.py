@@ -3,10 +3,10 @@
 from collections.abc import AsyncIterator
 from typing import Any
 
-from app.config import LLMProvider, get_settings
+from app.config import coerce_provider, get_settings
 from app.core.exceptions import LLMError, LLMProviderError
 from app.core.logging import get_logger, LogEvents
-from app.models.llm import ChatMessage, LLMResponse, MessageRole, StreamChunk, ToolCall, ToolResult
+from app.models.llm import ChatMessage, FormattedHistory, LLMResponse, MessageRole, StreamChunk, ToolCall, ToolResult
 from app.models.tools import Tool
 from app.providers.base import BaseLLMProvider
 from app.providers.registry import ProviderRegistry, get_provider
@@ -32,35 +32,28 @@ class LLMService:
         provider_name: str | None = None,
         model: str | None = None,
     ) -> BaseLLMProvider:
-        """Get a provider instance with optional overrides."""
-        if provider_name:
-            provider = ProviderRegistry.get_or_create_provider(
-                provider_name,
-                model=model,
-            )
-        else:
-            provider = get_provider()
-
-        # Override model if specified
-        if model and provider.model != model:
-            provider = ProviderRegistry.create_provider(
-                provider.provider_name,
-                model=model,
-            )
+        """Get a provider instance with optional overrides.
 
-        return provider
+        Model overrides are cached by the registry like default providers.
+        """
+        return get_provider(provider_name, model=model)
 
     def _build_messages(
         self,
-        user_message: str,
-        history: list[dict[str, Any]] | None = None,
+        user_message: str | None,
+        history: list[dict[str, Any]] | FormattedHistory | None = None,
         tool_results: list[ToolResult] | None = None,
     ) -> list[ChatMessage]:
-        """Build message list from history and current message."""
+        """Build message list from history and current message.
+
+        ``user_message`` may be None when history already ends with it.
+        """
         messages: list[ChatMessage] = []
 
         # Add history
-        if history:
+        if isinstance(history, FormattedHistory):
+            messages.extend(history.messages)
+        elif history:
             for msg in history:
                 messages.append(
                     ChatMessage(
@@ -70,12 +63,13 @@ class LLMService:
                 )
 
         # Add current user message
-        messages.append(
-            ChatMessage(
-                role=MessageRole.USER,
-                content=user_message,
+        if user_message is not None:
+            messages.append(
+                ChatMessage(
+                    role=MessageRole.USER,
+                    content=user_message,
+                )
             )
-        )
 
         # Add tool results if any
         if tool_results:
@@ -92,9 +86,9 @@ class LLMService:
 
     async def chat(
         self,
-        message: str,
+        message: str | None,
         system_prompt: str | None = None,
-        history: list[dict[str, Any]] | None = None,
+        history: list[dict[str, Any]] | FormattedHistory | None = None,
         provider_name: str | None = None,
         model: str | None = None,
         use_tools: bool = True,
@@ -110,7 +104,7 @@ class LLMService:
         4. Repeat until LLM returns final response
 
         Args:
-            message: User message
+            message: User message (None if history already ends with it)
             system_prompt: Optional system prompt
             history: Conversation history
             provider_name: Provider to use (defaults to configured default)
@@ -137,20 +131,28 @@ class LLMService:
         )
 
         messages = self._build_messages(message, history)
+        if isinstance(history, FormattedHistory) and history.stable_prefix:
+            kwargs.setdefault("cache_prefix", history.stable_prefix)
         iterations = 0
 
         while iterations < self._max_tool_iterations:
             iterations += 1
 
-            response = await provider.chat(
-                messages=messages,
-                system_prompt=system_prompt,
-                tools=tools,
-                **kwargs,
-            )
+            try:
+                response = await provider.chat(
+                    messages=messages,
+                    system_prompt=system_prompt,
+                    tools=tools,
+                    **kwargs,
+                )
+            except LLMProviderError:
+                # Don't let a cached health result hide the failure
+                provider.invalidate_health()
+                raise
 
             # If no tool calls, we're done
             if not response.tool_calls or response.finish_reason != "tool_calls":
+                response.used_tools = iterations > 1
                 logger.info(
                     LogEvents.LLM_REQUEST_COMPLETED,
                     provider=provider.provider_name,
@@ -209,9 +211,9 @@ class LLMService:
 
     async def stream(
         self,
-        message: str,
+        message: str | None,
         system_prompt: str | None = None,
-        history: list[dict[str, Any]] | None = None,
+        history: list[dict[str, Any]] | FormattedHistory | None = None,
         provider_name: str | None = None,
         model: str | None = None,
         use_tools: bool = True,
@@ -224,7 +226,7 @@ class LLMService:
         handles tool execution internally, yielding the final response.
 
         Args:
-            message: User message
+            message: User message (None if history already ends with it)
             system_prompt: Optional system prompt
             history: Conversation history
             provider_name: Provider to use
@@ -249,6 +251,8 @@ class LLMService:
         )
 
         messages = self._build_messages(message, history)
+        if isinstance(history, FormattedHistory) and history.stable_prefix:
+            kwargs.setdefault("cache_prefix", history.stable_prefix)
         iterations = 0
         accumulated_tool_calls: list[ToolCall] = []
         accumulated_content = ""
@@ -258,27 +262,32 @@ class LLMService:
             accumulated_tool_calls = []
             accumulated_content = ""
 
-            async for chunk in provider.stream(
-                messages=messages,
-                system_prompt=system_prompt,
-                tools=tools,
-                **kwargs,
-            ):
-                # Yield text content
-                if chunk.content:
-                    accumulated_content += chunk.content
-                    yield chunk
-
-                # Collect tool calls
-                if chunk.tool_calls:
-                    accumulated_tool_calls.extend(chunk.tool_calls)
-
-                # Check for completion
-                if chunk.done:
-                    if not accumulated_tool_calls or chunk.finish_reason != "tool_calls":
-                        # No tool calls - we're done
+            try:
+                async for chunk in provider.stream(
+                    messages=messages,
+                    system_prompt=system_prompt,
+                    tools=tools,
+                    **kwargs,
+                ):
+                    # Yield text content
+                    if chunk.content:
+                        accumulated_content += chunk.content
                         yield chunk
-                        return
+
+                    # Collect tool calls
+                    if chunk.tool_calls:
+                        accumulated_tool_calls.extend(chunk.tool_calls)
+
+                    # Check for completion
+                    if chunk.done:
+                        if not accumulated_tool_calls or chunk.finish_reason != "tool_calls":
+                            # No tool calls - we're done
+                            yield chunk
+                            return
+            except LLMProviderError:
+                # Don't let a cached health result hide the failure
+                provider.invalidate_health()
+                raise
 
             # Handle tool calls
             if accumulated_tool_calls:
@@ -332,7 +341,7 @@ class LLMService:
         preferred: str | None = None,
     ) -> BaseLLMProvider:
         """Get a healthy provider with fallback support."""
-        preferred_provider = LLMProvider(preferred) if preferred else None
+        preferred_provider = coerce_provider(preferred) if preferred else None
         return await ProviderRegistry.get_healthy_provider(preferred=preferred_provider)
 
     async def health_check(self, provider_name: str | None = None) -> dict[str, Any]:
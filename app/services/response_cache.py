@@ -0,0 +1,90 @@
+"""In-memory LRU cache for complete LLM responses."""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any
+
+from app.config import get_settings
+from app.core.logging import get_logger
+from app.models.llm import FormattedHistory
+
+logger = get_logger("response_cache")
+
+
+class ResponseCache:
+    """LRU cache of final LLM responses keyed by the request that produced them.
+
+    Uses in-memory storage for simplicity, like HistoryService. A size of
+    0 disables caching.
+    """
+
+    def __init__(self, max_size: int | None = None) -> None:
+        settings = get_settings()
+        self._max_size = settings.response_cache_size if max_size is None else max_size
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Check if caching is enabled."""
+        return self._max_size > 0
+
+    @staticmethod
+    def make_key(
+        provider: str | None,
+        model: str | None,
+        system_prompt: str,
+        history: FormattedHistory,
+        content: str,
+    ) -> bytes:
+        """Hash the parts of a request that determine its response.
+
+        The whole history window sent to the LLM is hashed, so only
+        conversations that are identical up to this turn share an answer.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for part in (provider or "", model or "", system_prompt):
+            h.update(part.encode("utf-8"))
+            h.update(b"\x00")
+        for msg in history.messages:
+            h.update(msg.role.value.encode("utf-8"))
+            h.update(b"\x01")
+            h.update(msg.content.encode("utf-8"))
+            h.update(b"\x00")
+        h.update(content.encode("utf-8"))
+        return h.digest()
+
+    def get(self, key: bytes) -> str | None:
+        """Get a cached response, marking it as recently used."""
+        response = self._entries.get(key)
+        if response is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        logger.debug("response_cache_hit", cache_size=len(self._entries))
+        return response
+
+    def put(self, key: bytes, response: str) -> None:
+        """Cache a response, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "cache_hits": self._hits,
+            "cache_misses": self._misses,
+        }
@@ -59,7 +59,6 @@ class UserService:
                 ),
                 default_preferences=default_prefs,
             )
-
             logger.info(
                 LogEvents.USER_CONFIG_LOADED,
                 user_count=len(users),
@@ -26,6 +26,7 @@ class WebexService:
         settings = get_settings()
         self._api = WebexTeamsAPI(access_token=settings.webex_bot_token)
         self._bot_info: Any | None = None
+        self._bot_email_lower: str | None = None
         self._executor = ThreadPoolExecutor(max_workers=4)
 
     async def _run_sync(self, func: Any, *args: Any, **kwargs: Any) -> Any:
@@ -53,8 +54,10 @@ class WebexService:
         return self._get_bot_info().id
 
     def is_from_self(self, person_email: str) -> bool:
-        """Check if a message is from the bot itself."""
-        return person_email == self.bot_email
+        """Check if a message is from the bot itself (case-insensitive)."""
+        if self._bot_email_lower is None:
+            self._bot_email_lower = self.bot_email.lower()
+        return person_email.lower() == self._bot_email_lower
 
     async def get_message(self, message_id: str) -> WebexMessage:
         """Retrieve a message by ID."""
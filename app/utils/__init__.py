@@ -1,10 +1,11 @@
 """Utility functions."""
 
-from app.utils.markdown_detector import detect_markdown, should_use_markdown
+from app.utils.markdown_detector import MarkdownDetector, detect_markdown, should_use_markdown
 from app.utils.message_chunker import chunk_message
 from app.utils.tool_converter import convert_tools_for_provider
 
 __all__ = [
+    "MarkdownDetector",
     "detect_markdown",
     "should_use_markdown",
     "chunk_message",
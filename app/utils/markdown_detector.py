@@ -89,6 +89,49 @@ def should_use_markdown(text: str) -> bool:
     return False
 
 
+class MarkdownDetector:
+    """
+    Incremental should_use_markdown() for a growing (streamed) buffer.
+
+    Once markdown is detected the answer sticks. Otherwise each update
+    rescans only from the start of the last line already seen, so
+    line-level patterns split across chunks are still caught. Patterns
+    spanning several lines (e.g. fenced code) may only show up in a full
+    should_use_markdown() check on the final text.
+    """
+
+    __slots__ = ("_scan_from", "_is_markdown")
+
+    def __init__(self) -> None:
+        self._scan_from = 0
+        self._is_markdown = False
+
+    def update(self, text: str) -> bool:
+        """
+        Classify the buffer, scanning only text not yet seen.
+
+        Args:
+            text: The full buffer so far (previous text plus new chunks)
+
+        Returns:
+            True if markdown should be used
+        """
+        if self._is_markdown:
+            return True
+
+        if len(text) > 500 or should_use_markdown(text[self._scan_from:]):
+            self._is_markdown = True
+            return True
+
+        self._scan_from = text.rfind("\n") + 1
+        return False
+
+    @property
+    def is_markdown(self) -> bool:
+        """Whether markdown has been detected so far."""
+        return self._is_markdown
+
+
 def escape_markdown(text: str) -> str:
     """
     Escape markdown special characters in text.
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from app.models.tools import Tool
+from app.models.tools import Tool, ToolRegistry
 
 
 def convert_tools_for_provider(
@@ -22,15 +22,8 @@ def convert_tools_for_provider(
     Raises:
         ValueError: If provider is unknown
     """
-    converters = {
-        "anthropic": lambda t: t.to_anthropic_format(),
-        "openai": lambda t: t.to_openai_format(),
-        "gemini": lambda t: t.to_gemini_format(),
-        "ollama": lambda t: t.to_ollama_format(),
-    }
-
-    converter = converters.get(provider)
-    if not converter:
+    converter = ToolRegistry.PROVIDER_FORMATTERS.get(provider)
+    if converter is None:
         raise ValueError(f"Unknown provider: {provider}")
 
     return [converter(tool) for tool in tools]